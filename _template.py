@@ -126,25 +126,24 @@ def build_value_to_variable_map():
     """
     Automatically builds the reverse mapping from the definitions above.
     Returns a dict: { "raw_value": "var(--variable-name)" }
+    Keys are canonical lowercase; callers lowercase values before lookup.
     """
     mapping = {}
     
     # Map colors
     for name, value in BRAND_COLORS.items():
         css_var = f"var(--color-{name})"
-        # Store both lowercase and original case for matching
         mapping[value.lower()] = css_var
-        mapping[value.upper()] = css_var
     
     # Map typography values
     for name, value in TYPOGRAPHY.items():
         css_var = f"var(--{name})"
-        mapping[value] = css_var
+        mapping[value.lower()] = css_var
     
     # Map spacing values
     for name, value in SPACING.items():
         css_var = f"var(--{name})"
-        mapping[value] = css_var
+        mapping[value.lower()] = css_var
     
     return mapping
 
@@ -164,8 +163,8 @@ CUSTOM_MAPPINGS = {
     # "1.5em": "var(--line-height-normal)",
 }
 
-# Merge custom mappings
-VALUE_TO_VARIABLE.update(CUSTOM_MAPPINGS)
+# Merge custom mappings (keys lowercased to match the rest of the map)
+VALUE_TO_VARIABLE.update({value.lower(): css_var for value, css_var in CUSTOM_MAPPINGS.items()})
 
 
 # =============================================================================
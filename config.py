@@ -13,6 +13,8 @@ Date: January 2026
 ================================================================================
 """
 
+import re
+
 # =============================================================================
 # CRAWLER SETTINGS
 # =============================================================================
@@ -29,11 +31,35 @@ DEFAULT_RATE_LIMIT = 0.5
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30
 
+# Seconds to wait for a connection before giving up on a page
+CONNECT_TIMEOUT = 5
+
+# Largest page body (in bytes) the crawler will download
+# Anything bigger is almost certainly not a page worth auditing
+MAX_PAGE_BYTES = 4 << 20  # 4 MB
+
+# On-disk HTTP cache for repeat audits (--cache, needs requests-cache)
+# Pages are reused for this many seconds, then revalidated with the server
+HTTP_CACHE_NAME = ".audit_cache"
+HTTP_CACHE_EXPIRE = 3600
+
+# With --cache, the design auditor also keeps downloaded stylesheets on disk
+# Reused for this many seconds unless the server's Cache-Control says otherwise
+STYLESHEET_CACHE_NAME = ".audit_cache_css"
+STYLESHEET_CACHE_EXPIRE = 86400
+
+# Pages fetched concurrently per batch
+# Request starts are still spaced by the rate limit; this only lets
+# slow responses overlap instead of waiting on each one in turn
+DEFAULT_CONCURRENCY = 4
+
 # =============================================================================
 # URL EXCLUSION PATTERNS
 # =============================================================================
 # Regex patterns for URLs to skip during crawling
 # Add patterns here to exclude specific paths, file types, or URL structures
+# Patterns use search() semantics: they match anywhere in the URL, so there's
+# no need to pad them with ".*" / ".+$" to cover the rest of the URL
 
 EXCLUDED_PATTERNS = [
     # Admin and system paths
@@ -72,6 +98,16 @@ EXCLUDED_PATTERNS = [
     r"\.xml$",
 ]
 
+# All exclusion patterns fused into a single alternation, compiled once at
+# import so URL filtering is one search() per URL instead of one per pattern.
+# Keep EXCLUDED_PATTERNS as the editable source list; match against this.
+# URLs reaching the filter are ASCII (IDNA hosts, percent-encoded paths), so
+# re.ASCII keeps \d and friends on the cheaper ASCII-only character classes.
+EXCLUDED_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in EXCLUDED_PATTERNS),
+    re.IGNORECASE | re.ASCII,
+)
+
 # =============================================================================
 # COLOR ANALYSIS SETTINGS
 # =============================================================================
@@ -8,22 +8,87 @@ Location: ~/scripts/audit_tool/core/design_auditor.py
 """
 
 import re
+import csv
+import sys
+import math
+import logging
+import functools
+from collections import Counter
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from datetime import datetime
 
+# Import config with fallback
+try:
+    from config import CSV_ENCODING, CSV_DELIMITER
+except ImportError:
+    CSV_ENCODING = "utf-8"
+    CSV_DELIMITER = ","
+
+_log = logging.getLogger(__name__)
+
+# NumPy is optional - without it the palette scan falls back to pure Python.
+# It's imported on first use (see _np) so --help and audits that never reach
+# a hex near-match don't pay its import time.
+_NUMPY_UNRESOLVED = object()
+_numpy = _NUMPY_UNRESOLVED
+
+
+def _np():
+    """Import NumPy on first call; returns the module, or None if not installed."""
+    global _numpy
+    if _numpy is _NUMPY_UNRESOLVED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+# =============================================================================
+# ISSUE VOCABULARY
+# =============================================================================
+
+# Issue fields drawn from a small fixed set of values. Interned once here so
+# every issue shares the same string objects.
+TYPE_COLOR = sys.intern('color')
+TYPE_FONT = sys.intern('font')
+TYPE_SPACING = sys.intern('spacing')
+TYPE_IMAGE = sys.intern('image')
+
+SEV_HIGH = sys.intern('high')
+SEV_MED = sys.intern('medium')
+SEV_LOW = sys.intern('low')
+
+MATCH_EXACT = sys.intern('exact')
+MATCH_NEAR = sys.intern('near')
+
+CTX_INLINE = sys.intern('Inline Style')
+CTX_EMBED = sys.intern('Custom Code Embed')
+CTX_GLOBAL = sys.intern('Global Custom Code')
+CTX_COMPONENT = sys.intern('Component Override')
+CTX_COMBO = sys.intern('Combo Class')
+CTX_CLASS = sys.intern('Class Style')
+
 
 # =============================================================================
 # COLOR UTILITIES
 # =============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
+    hex_color = hex_color.removeprefix('#')
+    value = int(hex_color, 16)
     if len(hex_color) == 3:
-        hex_color = ''.join([c*2 for c in hex_color])
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # #abc -> #aabbcc: multiplying a nibble by 17 (0x11) duplicates it
+        return ((value >> 8) * 17, ((value >> 4) & 0xf) * 17, (value & 0xf) * 17)
+    return (value >> 16, (value >> 8) & 0xff, value & 0xff)
 
 
+@functools.lru_cache(maxsize=4096)
 def rgb_to_lab(rgb):
     """Convert RGB to LAB color space for Delta E calculation."""
     # Normalize RGB values
@@ -51,14 +116,315 @@ def rgb_to_lab(rgb):
     return (L, a, b)
 
 
+def lab_distance(lab1, lab2):
+    """Calculate CIE76 Delta E between two LAB tuples."""
+    return ((lab1[0] - lab2[0]) ** 2 + 
+            (lab1[1] - lab2[1]) ** 2 + 
+            (lab1[2] - lab2[2]) ** 2) ** 0.5
+
+
 def delta_e(color1, color2):
     """Calculate CIE Delta E (color difference) between two colors."""
     lab1 = rgb_to_lab(hex_to_rgb(color1))
     lab2 = rgb_to_lab(hex_to_rgb(color2))
     
-    return ((lab1[0] - lab2[0]) ** 2 + 
-            (lab1[1] - lab2[1]) ** 2 + 
-            (lab1[2] - lab2[2]) ** 2) ** 0.5
+    return lab_distance(lab1, lab2)
+
+
+def delta_e_2000(lab1, lab2):
+    """
+    Calculate CIEDE2000 Delta E between two LAB tuples.
+    
+    Follows Sharma, Wu & Dalal (2005). Perceptually closer than CIE76,
+    especially for saturated blues and near-neutral grays.
+    """
+    L1, a1, b1 = lab1
+    L2, a2, b2 = lab2
+    
+    # Chroma-dependent a' adjustment
+    c_bar = (math.hypot(a1, b1) + math.hypot(a2, b2)) / 2
+    c_bar7 = c_bar ** 7
+    g = 0.5 * (1 - math.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = math.hypot(a1p, b1)
+    c2p = math.hypot(a2p, b2)
+    h1p = math.degrees(math.atan2(b1, a1p)) % 360
+    h2p = math.degrees(math.atan2(b2, a2p)) % 360
+    
+    # Differences in lightness, chroma and hue
+    dLp = L2 - L1
+    dCp = c2p - c1p
+    dhp = h2p - h1p
+    if c1p * c2p == 0:
+        dhp = 0.0
+    elif dhp > 180:
+        dhp -= 360
+    elif dhp < -180:
+        dhp += 360
+    dHp = 2 * math.sqrt(c1p * c2p) * math.sin(math.radians(dhp) / 2)
+    
+    # Means
+    L_bar = (L1 + L2) / 2
+    c_bar_p = (c1p + c2p) / 2
+    h_bar_p = h1p + h2p
+    if c1p * c2p != 0:
+        if abs(h1p - h2p) > 180:
+            h_bar_p += 360 if h_bar_p < 360 else -360
+        h_bar_p /= 2
+    
+    # Weighting functions and rotation term
+    t = (1 - 0.17 * math.cos(math.radians(h_bar_p - 30))
+         + 0.24 * math.cos(math.radians(2 * h_bar_p))
+         + 0.32 * math.cos(math.radians(3 * h_bar_p + 6))
+         - 0.20 * math.cos(math.radians(4 * h_bar_p - 63)))
+    d_theta = 30 * math.exp(-((h_bar_p - 275) / 25) ** 2)
+    c_bar_p7 = c_bar_p ** 7
+    r_c = 2 * math.sqrt(c_bar_p7 / (c_bar_p7 + 25 ** 7))
+    s_l = 1 + (0.015 * (L_bar - 50) ** 2) / math.sqrt(20 + (L_bar - 50) ** 2)
+    s_c = 1 + 0.045 * c_bar_p
+    s_h = 1 + 0.015 * c_bar_p * t
+    r_t = -math.sin(math.radians(2 * d_theta)) * r_c
+    
+    return math.sqrt(
+        (dLp / s_l) ** 2 + (dCp / s_c) ** 2 + (dHp / s_h) ** 2
+        + r_t * (dCp / s_c) * (dHp / s_h)
+    )
+
+
+def delta_e_2000_batch(found_lab, palette_lab, palette_chroma):
+    """
+    Vectorized CIEDE2000 from one LAB color to every palette color (requires NumPy).
+    
+    Args:
+        found_lab: LAB tuple of the color being checked
+        palette_lab: (M, 3) array of palette LAB values
+        palette_chroma: (M,) array of precomputed palette C* values
+    
+    Returns:
+        (M,) array of Delta E values
+    """
+    np = _np()
+    L1, a1, b1 = found_lab
+    L2, a2, b2 = palette_lab[:, 0], palette_lab[:, 1], palette_lab[:, 2]
+    
+    c_bar = (math.hypot(a1, b1) + palette_chroma) / 2
+    c_bar7 = c_bar ** 7
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = np.hypot(a1p, b1)
+    c2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    
+    dLp = L2 - L1
+    dCp = c2p - c1p
+    has_hue = (c1p * c2p) != 0
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(has_hue, dhp, 0.0)
+    dHp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dhp) / 2)
+    
+    L_bar = (L1 + L2) / 2
+    c_bar_p = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_bar_p = np.where(
+        np.abs(h1p - h2p) > 180,
+        np.where(h_sum < 360, h_sum + 360, h_sum - 360) / 2,
+        h_sum / 2,
+    )
+    h_bar_p = np.where(has_hue, h_bar_p, h_sum)
+    
+    t = (1 - 0.17 * np.cos(np.radians(h_bar_p - 30))
+         + 0.24 * np.cos(np.radians(2 * h_bar_p))
+         + 0.32 * np.cos(np.radians(3 * h_bar_p + 6))
+         - 0.20 * np.cos(np.radians(4 * h_bar_p - 63)))
+    d_theta = 30 * np.exp(-((h_bar_p - 275) / 25) ** 2)
+    c_bar_p7 = c_bar_p ** 7
+    r_c = 2 * np.sqrt(c_bar_p7 / (c_bar_p7 + 25 ** 7))
+    s_l = 1 + (0.015 * (L_bar - 50) ** 2) / np.sqrt(20 + (L_bar - 50) ** 2)
+    s_c = 1 + 0.045 * c_bar_p
+    s_h = 1 + 0.015 * c_bar_p * t
+    r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+    
+    return np.sqrt(
+        (dLp / s_l) ** 2 + (dCp / s_c) ** 2 + (dHp / s_h) ** 2
+        + r_t * (dCp / s_c) * (dHp / s_h)
+    )
+
+
+# Well-formed 3- or 6-digit hex colors - anything else is skipped up front
+# rather than left to fail inside hex_to_rgb()
+_VALID_HEX = re.compile(r'^#(?:[0-9a-fA-F]{3}){1,2}$')
+
+
+# Derived palette data, keyed by id() of the value map it was built from.
+# The map itself is kept in the entry so a recycled id() can't be mistaken
+# for a palette we've already converted.
+_PALETTE_CACHE = {}
+
+
+def _palette_cache(value_to_variable_map):
+    """Get the dict of derived data cached for a value map."""
+    cached = _PALETTE_CACHE.get(id(value_to_variable_map))
+    if cached is not None and cached[0] is value_to_variable_map:
+        return cached[1]
+    
+    derived = {}
+    _PALETTE_CACHE[id(value_to_variable_map)] = (value_to_variable_map, derived)
+    return derived
+
+
+def get_palette_hex(value_to_variable_map):
+    """
+    Get the distinct, well-formed hex colors in a value map.
+    
+    Args:
+        value_to_variable_map: Dict mapping values to variable names
+    
+    Returns:
+        List of (lowercase_hex, variable_name) tuples in map order
+    """
+    derived = _palette_cache(value_to_variable_map)
+    if 'hex' in derived:
+        return derived['hex']
+    
+    entries = []
+    seen = set()
+    for known_value, var_name in value_to_variable_map.items():
+        if not known_value.startswith('#'):
+            continue
+        
+        # Older palettes store both cases of each color; keep each one once
+        key = known_value.lower()
+        if key in seen or not _VALID_HEX.match(key):
+            continue
+        seen.add(key)
+        
+        entries.append((key, var_name))
+    
+    derived['hex'] = entries
+    return entries
+
+
+def get_palette_lab(value_to_variable_map):
+    """
+    Get the LAB values for every hex color in a value map.
+    
+    Converted once per map, so the Delta E scan only pays the gamma/cube-root
+    math for the found color.
+    
+    Args:
+        value_to_variable_map: Dict mapping values to variable names
+    
+    Returns:
+        List of (hex_value, variable_name, lab) tuples in map order
+    """
+    derived = _palette_cache(value_to_variable_map)
+    if 'lab' not in derived:
+        derived['lab'] = [
+            (hex_value, var_name, rgb_to_lab(hex_to_rgb(hex_value)))
+            for hex_value, var_name in get_palette_hex(value_to_variable_map)
+        ]
+    return derived['lab']
+
+
+def get_palette_rgb_array(value_to_variable_map):
+    """
+    Get the palette colors as an (M, 3) uint8 RGB array (requires NumPy).
+    
+    Hex strings are parsed once per map; variable names are kept in a
+    parallel tuple so row i of the array belongs to variable_names[i].
+    
+    Args:
+        value_to_variable_map: Dict mapping values to variable names
+    
+    Returns:
+        Tuple of (rgb_array, variable_names) with rows in map order
+    """
+    np = _np()
+    derived = _palette_cache(value_to_variable_map)
+    if 'rgb_array' not in derived:
+        entries = get_palette_hex(value_to_variable_map)
+        rgb_array = np.empty((len(entries), 3), dtype=np.uint8)
+        for row, (hex_value, _) in enumerate(entries):
+            rgb_array[row] = hex_to_rgb(hex_value)
+        derived['rgb_array'] = (rgb_array, tuple(var_name for _, var_name in entries))
+    return derived['rgb_array']
+
+
+def rgb_array_to_lab(rgb_array):
+    """Convert an (M, 3) RGB array to LAB; vectorized rgb_to_lab (requires NumPy)."""
+    np = _np()
+    rgb = rgb_array.astype(np.float64) / 255.0
+    rgb = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+    
+    xyz = rgb @ np.array([
+        [0.4124564, 0.2126729, 0.0193339],
+        [0.3575761, 0.7151522, 0.1191920],
+        [0.1804375, 0.0721750, 0.9503041],
+    ])
+    xyz /= (0.95047, 1.00000, 1.08883)
+    xyz = np.where(xyz > 0.008856, np.cbrt(xyz), (7.787 * xyz) + (16/116))
+    
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+    return np.stack(((116 * y) - 16, 500 * (x - y), 200 * (y - z)), axis=1)
+
+
+def get_palette_lab_array(value_to_variable_map):
+    """
+    Get the palette LAB values as an (M, 3) float32 array (requires NumPy).
+    
+    Built from the uint8 RGB array in one vectorized pass. The palette-side
+    C* (chroma) term of CIEDE2000 is precomputed alongside, so each lookup
+    only pays for the terms that depend on the found color.
+    
+    Args:
+        value_to_variable_map: Dict mapping values to variable names
+    
+    Returns:
+        Tuple of (lab_array, chroma, variable_names) with rows in map order
+    """
+    np = _np()
+    derived = _palette_cache(value_to_variable_map)
+    if 'lab_array' not in derived:
+        rgb_array, var_names = get_palette_rgb_array(value_to_variable_map)
+        lab_array = rgb_array_to_lab(rgb_array).astype(np.float32)
+        derived['lab_array'] = (
+            lab_array,
+            np.hypot(lab_array[:, 1], lab_array[:, 2]),
+            var_names,
+        )
+    return derived['lab_array']
+
+
+def find_nearest_palette_color(found_lab, value_to_variable_map):
+    """
+    Find the palette color closest to a LAB value (CIEDE2000).
+    
+    Args:
+        found_lab: LAB tuple of the color being checked
+        value_to_variable_map: Dict mapping values to variable names
+    
+    Returns:
+        Tuple of (variable_name, delta_e), or (None, inf) if the map has no colors
+    """
+    if _np() is not None:
+        lab_array, chroma, var_names = get_palette_lab_array(value_to_variable_map)
+        if not var_names:
+            return None, float('inf')
+        distances = delta_e_2000_batch(found_lab, lab_array, chroma)
+        idx = int(distances.argmin())
+        return var_names[idx], float(distances[idx])
+    
+    nearest = None
+    min_diff = float('inf')
+    for _, var_name, known_lab in get_palette_lab(value_to_variable_map):
+        diff = delta_e_2000(found_lab, known_lab)
+        if diff < min_diff:
+            nearest, min_diff = var_name, diff
+    return nearest, min_diff
 
 
 # =============================================================================
@@ -75,60 +441,107 @@ PATTERNS = {
 }
 
 
-def extract_colors_from_css(css_text):
-    """Extract all color values from CSS text."""
-    colors = []
+def get_palette_px(value_to_variable_map):
+    """
+    Get the pixel values in a value map, indexed by their integer size.
     
-    # Find hex colors
-    for match in PATTERNS['hex_color'].finditer(css_text):
-        colors.append({
-            'value': match.group(0),
-            'type': 'hex',
-            'position': match.start()
-        })
+    Built once per map so spacing near-matches are a few dict probes instead
+    of a regex match against every key.
     
-    # Find RGB/RGBA colors
-    for match in PATTERNS['rgb_color'].finditer(css_text):
-        colors.append({
-            'value': match.group(0),
-            'type': 'rgb',
-            'position': match.start()
-        })
+    Args:
+        value_to_variable_map: Dict mapping values to variable names
     
-    return colors
+    Returns:
+        Dict mapping pixel size (int) to variable name; the first entry in
+        map order wins when several variables share a size
+    """
+    derived = _palette_cache(value_to_variable_map)
+    if 'px' in derived:
+        return derived['px']
+    
+    px_map = {}
+    for known_value, var_name in value_to_variable_map.items():
+        known_match = PATTERNS['pixel_value'].match(known_value)
+        if known_match:
+            px_map.setdefault(int(known_match.group(1)), var_name)
+    
+    derived['px'] = px_map
+    return px_map
 
 
-def extract_spacing_from_css(css_text):
-    """Extract all spacing/size values from CSS text."""
-    values = []
+# Single-pass tokenizer covering every PATTERNS category the extractors use,
+# so a stylesheet is scanned once instead of once per value type
+TOKEN_RE = re.compile(
+    r'(?P<hex>#[0-9A-Fa-f]{3}(?:[0-9A-Fa-f]{3})?\b)'
+    r'|(?P<rgb>rgba?\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*(?:,\s*[\d.]+\s*)?\))'
+    r'|(?P<px>\b\d+px\b)'
+    r'|(?P<rem>\b[\d.]+rem\b)'
+)
+
+
+def extract_values_from_css(css_text):
+    """
+    Extract color and spacing values from CSS text in a single scan.
     
-    for match in PATTERNS['pixel_value'].finditer(css_text):
-        values.append({
-            'value': match.group(0),
-            'numeric': int(match.group(1)),
-            'unit': 'px',
-            'position': match.start()
-        })
+    Returns:
+        Tuple of (colors, spacing_values) in the same shape as
+        extract_colors_from_css and extract_spacing_from_css
+    """
+    hex_colors, rgb_colors = [], []
+    px_values, rem_values = [], []
     
-    for match in PATTERNS['rem_value'].finditer(css_text):
-        values.append({
-            'value': match.group(0),
-            'numeric': float(match.group(1)),
-            'unit': 'rem',
-            'position': match.start()
-        })
+    for match in TOKEN_RE.finditer(css_text):
+        kind = match.lastgroup
+        value = match.group(0)
+        
+        if kind == 'hex':
+            hex_colors.append({'value': value, 'type': 'hex', 'position': match.start()})
+        elif kind == 'rgb':
+            rgb_colors.append({'value': value, 'type': 'rgb', 'position': match.start()})
+        elif kind == 'px':
+            px_values.append({
+                'value': value,
+                'numeric': int(value[:-2]),
+                'unit': 'px',
+                'position': match.start()
+            })
+        else:
+            rem_values.append({
+                'value': value,
+                'numeric': float(value[:-3]),
+                'unit': 'rem',
+                'position': match.start()
+            })
     
-    return values
+    return hex_colors + rgb_colors, px_values + rem_values
+
+
+def extract_colors_from_css(css_text):
+    """Extract all color values from CSS text."""
+    return extract_values_from_css(css_text)[0]
+
+
+def extract_spacing_from_css(css_text):
+    """Extract all spacing/size values from CSS text."""
+    return extract_values_from_css(css_text)[1]
 
 
 # =============================================================================
 # VARIABLE CANDIDATE DETECTION
 # =============================================================================
 
+# Upper bound on memoized lookups kept per value map
+_CANDIDATE_CACHE_SIZE = 8192
+
+
 def find_variable_candidate(value, value_to_variable_map, tolerances=None):
     """
     Check if a hard-coded value matches a design system variable.
     
+    Results are memoized per value map, since the same handful of colors and
+    sizes recur across thousands of elements. Treat the returned dict as
+    read-only - it is shared between calls.
+    
     Args:
         value: The raw value found in CSS (e.g., "#0A1F44", "24px")
         value_to_variable_map: Dict mapping values to variable names
@@ -139,50 +552,57 @@ def find_variable_candidate(value, value_to_variable_map, tolerances=None):
     """
     tolerances = tolerances or {'color_delta_e': 3.0, 'spacing_px': 2}
     
+    derived = _palette_cache(value_to_variable_map)
+    cache = derived.setdefault('candidates', {})
+    key = (value, tuple(sorted(tolerances.items())))
+    if key in cache:
+        return cache[key]
+    
+    if len(cache) >= _CANDIDATE_CACHE_SIZE:
+        cache.clear()
+    
+    candidate = _find_variable_candidate(value, value_to_variable_map, tolerances)
+    cache[key] = candidate
+    return candidate
+
+
+def _find_variable_candidate(value, value_to_variable_map, tolerances):
+    """Uncached body of find_variable_candidate."""
     # Normalize the value for lookup
     normalized = value.lower().strip()
     
-    # Direct match
+    # Direct match (palette keys are canonical lowercase)
     if normalized in value_to_variable_map:
         return {
             'variable_name': value_to_variable_map[normalized],
-            'match_type': 'exact'
-        }
-    
-    # Check uppercase version
-    if value.upper() in value_to_variable_map:
-        return {
-            'variable_name': value_to_variable_map[value.upper()],
-            'match_type': 'exact'
+            'match_type': MATCH_EXACT
         }
     
     # For hex colors, try near-match using Delta E
-    if normalized.startswith('#'):
-        for known_value, var_name in value_to_variable_map.items():
-            if known_value.startswith('#'):
-                try:
-                    diff = delta_e(normalized, known_value)
-                    if diff <= tolerances['color_delta_e']:
-                        return {
-                            'variable_name': var_name,
-                            'match_type': 'near',
-                            'delta_e': round(diff, 2)
-                        }
-                except:
-                    continue
+    if _VALID_HEX.match(normalized):
+        found_lab = rgb_to_lab(hex_to_rgb(normalized))
+        var_name, diff = find_nearest_palette_color(found_lab, value_to_variable_map)
+        if var_name is not None and diff <= tolerances['color_delta_e']:
+            return {
+                'variable_name': var_name,
+                'match_type': MATCH_NEAR,
+                'delta_e': round(diff, 2)
+            }
     
     # For pixel values, try near-match within tolerance
     px_match = PATTERNS['pixel_value'].match(value)
     if px_match:
         found_px = int(px_match.group(1))
-        for known_value, var_name in value_to_variable_map.items():
-            known_match = PATTERNS['pixel_value'].match(known_value)
-            if known_match:
-                known_px = int(known_match.group(1))
-                if abs(found_px - known_px) <= tolerances['spacing_px']:
+        px_map = get_palette_px(value_to_variable_map)
+        
+        # Probe outward from the found size so the closest variable wins
+        for step in range(int(tolerances['spacing_px']) + 1):
+            for known_px in (found_px - step, found_px + step):
+                var_name = px_map.get(known_px)
+                if var_name is not None:
                     return {
                         'variable_name': var_name,
-                        'match_type': 'near',
+                        'match_type': MATCH_NEAR,
                         'difference_px': found_px - known_px
                     }
     
@@ -193,6 +613,18 @@ def find_variable_candidate(value, value_to_variable_map, tolerances=None):
 # SOURCE CONTEXT DETECTION (Hiding Spots)
 # =============================================================================
 
+# Scraper flags in priority order; the first one set on an element wins
+_CONTEXT_RULES = (
+    ('has_inline_style', CTX_INLINE),
+    ('in_embed', CTX_EMBED),          # Webflow custom code embed
+    ('parent_is_embed', CTX_EMBED),
+    ('from_head', CTX_GLOBAL),
+    ('from_footer', CTX_GLOBAL),
+    ('is_component_override', CTX_COMPONENT),
+    ('has_combo_class', CTX_COMBO),
+)
+
+
 def detect_source_context(element_data):
     """
     Determine where a style is coming from (the "hiding spot").
@@ -203,34 +635,103 @@ def detect_source_context(element_data):
     Returns:
         String indicating the source context
     """
-    # Check for inline styles
-    if element_data.get('has_inline_style'):
-        return 'Inline Style'
-    
-    # Check for Webflow custom code embed
-    if element_data.get('in_embed') or element_data.get('parent_is_embed'):
-        return 'Custom Code Embed'
-    
-    # Check for global custom code
-    if element_data.get('from_head') or element_data.get('from_footer'):
-        return 'Global Custom Code'
-    
-    # Check for component override
-    if element_data.get('is_component_override'):
-        return 'Component Override'
-    
-    # Check for combo class
-    if element_data.get('has_combo_class'):
-        return 'Combo Class'
+    for flag, label in _CONTEXT_RULES:
+        if element_data.get(flag):
+            return label
     
     # Default to standard class
-    return 'Class Style'
+    return CTX_CLASS
+
+
+# =============================================================================
+# ISSUE RECORDS
+# =============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls):
+    """Get the field names of an issue class, in declaration order."""
+    return tuple(f.name for f in fields(cls))
+
+
+class _AsDict:
+    """Mixin that serializes a slotted issue to a plain dict."""
+    __slots__ = ()
+    
+    def as_dict(self):
+        """Return the issue as a dict (for CSV/Excel export)."""
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+
+@dataclass(slots=True, frozen=True)
+class Issue(_AsDict):
+    """A hard-coded style value that should use a design variable."""
+    type: str
+    page_url: str
+    element: str
+    selector: str
+    property: str
+    found_value: str
+    expected_value: str
+    variable_candidate: str
+    source_context: str
+    severity: str
+    notes: str
+
+
+@dataclass(slots=True, frozen=True)
+class ColorIssue(Issue):
+    """Color issue; records whether the palette match was exact or near."""
+    match_type: str
+
+
+@dataclass(slots=True, frozen=True)
+class FontIssue(Issue):
+    """Typography issue; carries the rest of the element's type settings."""
+    font_size: str
+    font_weight: str
+    line_height: str
+
+
+@dataclass(slots=True, frozen=True)
+class ImageIssue(_AsDict):
+    """Missing alt text or oversized image."""
+    type: str
+    page_url: str
+    image_url: str
+    alt_text: str
+    issue_subtype: str
+    current_size: str
+    recommended_size: str
+    dimensions: str
+    format: str
+    severity: str
+    notes: str
 
 
 # =============================================================================
 # MAIN AUDIT FUNCTIONS
 # =============================================================================
 
+# Style properties checked by each audit. The tuples fix the reporting order;
+# the frozensets let an element without any of them be skipped in one check.
+_COLOR_PROPS = tuple(sys.intern(prop) for prop in (
+    'color', 'background-color', 'border-color', 'fill', 'stroke'
+))
+_COLOR_PROP_SET = frozenset(_COLOR_PROPS)
+
+_SPACING_PROPS = tuple(sys.intern(prop) for prop in (
+    'margin', 'margin-top', 'margin-right', 'margin-bottom', 'margin-left',
+    'padding', 'padding-top', 'padding-right', 'padding-bottom', 'padding-left',
+    'gap', 'row-gap', 'column-gap'
+))
+_SPACING_PROP_SET = frozenset(_SPACING_PROPS)
+
+# Computed spacing values that can never map to a palette variable
+_SKIP_SPACING = frozenset({
+    '0', '0px', '0em', '0rem', 'auto', 'normal', 'inherit', 'initial'
+})
+
+
 def audit_colors(page_data, palette, verbose=False):
     """
     Audit a page for color violations.
@@ -238,22 +739,30 @@ def audit_colors(page_data, palette, verbose=False):
     Args:
         page_data: Dict containing scraped page data
         palette: Loaded palette module with BRAND_COLORS and VALUE_TO_VARIABLE
-        verbose: Enable verbose logging
+        verbose: Unused; progress is logged at DEBUG (see configure_logging)
     
     Returns:
-        List of issue dicts
+        List of issue records
     """
     issues = []
     value_map = getattr(palette, 'VALUE_TO_VARIABLE', {})
     tolerances = getattr(palette, 'TOLERANCES', {})
     brand_colors = getattr(palette, 'BRAND_COLORS', {})
     
+    # Bind hot lookups to locals once per page
+    page_url = page_data.get('url', '')
+    find = find_variable_candidate
+    detect = detect_source_context
+    
     for element in page_data.get('elements', []):
         # Extract colors from element's computed styles
         styles = element.get('computed_styles', {})
+        if not styles or _COLOR_PROP_SET.isdisjoint(styles):
+            continue
+        styles_get = styles.get
         
-        for prop in ['color', 'background-color', 'border-color', 'fill', 'stroke']:
-            value = styles.get(prop)
+        for prop in _COLOR_PROPS:
+            value = styles_get(prop)
             if not value:
                 continue
             
@@ -262,28 +771,27 @@ def audit_colors(page_data, palette, verbose=False):
                 continue
             
             # Check if this is a hard-coded value that should be a variable
-            candidate = find_variable_candidate(value, value_map, tolerances)
+            candidate = find(value, value_map, tolerances)
             
             if candidate:
-                source_context = detect_source_context(element)
+                source_context = detect(element)
                 
-                issues.append({
-                    'type': 'color',
-                    'page_url': page_data.get('url', ''),
-                    'element': element.get('tag', 'unknown'),
-                    'selector': element.get('selector', ''),
-                    'property': prop,
-                    'found_value': value,
-                    'expected_value': candidate['variable_name'],
-                    'variable_candidate': candidate['variable_name'],
-                    'match_type': candidate['match_type'],
-                    'source_context': source_context,
-                    'severity': 'high' if candidate['match_type'] == 'exact' else 'medium',
-                    'notes': f"Hard-coded value should use variable: {candidate['variable_name']}"
-                })
+                issues.append(ColorIssue(
+                    type=TYPE_COLOR,
+                    page_url=page_url,
+                    element=element.get('tag', 'unknown'),
+                    selector=element.get('selector', ''),
+                    property=prop,
+                    found_value=value,
+                    expected_value=candidate['variable_name'],
+                    variable_candidate=candidate['variable_name'],
+                    match_type=candidate['match_type'],
+                    source_context=source_context,
+                    severity=SEV_HIGH if candidate['match_type'] == MATCH_EXACT else SEV_MED,
+                    notes=f"Hard-coded value should use variable: {candidate['variable_name']}"
+                ))
                 
-                if verbose:
-                    print(f"  [COLOR] {element.get('selector')}: {value} → {candidate['variable_name']}")
+                _log.debug("  [COLOR] %s: %s → %s", element.get('selector'), value, candidate['variable_name'])
     
     return issues
 
@@ -295,45 +803,51 @@ def audit_fonts(page_data, palette, verbose=False):
     Args:
         page_data: Dict containing scraped page data
         palette: Loaded palette module with TYPOGRAPHY
-        verbose: Enable verbose logging
+        verbose: Unused; progress is logged at DEBUG (see configure_logging)
     
     Returns:
-        List of issue dicts
+        List of issue records
     """
     issues = []
     value_map = getattr(palette, 'VALUE_TO_VARIABLE', {})
     tolerances = getattr(palette, 'TOLERANCES', {})
     
+    # Bind hot lookups to locals once per page
+    page_url = page_data.get('url', '')
+    find = find_variable_candidate
+    detect = detect_source_context
+    
     for element in page_data.get('elements', []):
         styles = element.get('computed_styles', {})
+        if not styles:
+            continue
         
         # Check font-size
         font_size = styles.get('font-size')
         if font_size and 'var(--' not in font_size:
-            candidate = find_variable_candidate(font_size, value_map, tolerances)
+            candidate = find(font_size, value_map, tolerances)
             
             if candidate:
-                source_context = detect_source_context(element)
+                source_context = detect(element)
                 
-                issues.append({
-                    'type': 'font',
-                    'page_url': page_data.get('url', ''),
-                    'element': element.get('tag', 'unknown'),
-                    'selector': element.get('selector', ''),
-                    'property': 'font-size',
-                    'found_value': font_size,
-                    'expected_value': candidate['variable_name'],
-                    'variable_candidate': candidate['variable_name'],
-                    'font_size': font_size,
-                    'font_weight': styles.get('font-weight', ''),
-                    'line_height': styles.get('line-height', ''),
-                    'source_context': source_context,
-                    'severity': 'medium',
-                    'notes': f"Font size should use variable: {candidate['variable_name']}"
-                })
+                issues.append(FontIssue(
+                    type=TYPE_FONT,
+                    page_url=page_url,
+                    element=element.get('tag', 'unknown'),
+                    selector=element.get('selector', ''),
+                    property='font-size',
+                    found_value=font_size,
+                    expected_value=candidate['variable_name'],
+                    variable_candidate=candidate['variable_name'],
+                    font_size=font_size,
+                    font_weight=styles.get('font-weight', ''),
+                    line_height=styles.get('line-height', ''),
+                    source_context=source_context,
+                    severity=SEV_MED,
+                    notes=f"Font size should use variable: {candidate['variable_name']}"
+                ))
                 
-                if verbose:
-                    print(f"  [FONT] {element.get('selector')}: {font_size} → {candidate['variable_name']}")
+                _log.debug("  [FONT] %s: %s → %s", element.get('selector'), font_size, candidate['variable_name'])
     
     return issues
 
@@ -345,50 +859,56 @@ def audit_spacing(page_data, palette, verbose=False):
     Args:
         page_data: Dict containing scraped page data
         palette: Loaded palette module with SPACING
-        verbose: Enable verbose logging
+        verbose: Unused; progress is logged at DEBUG (see configure_logging)
     
     Returns:
-        List of issue dicts
+        List of issue records
     """
     issues = []
     value_map = getattr(palette, 'VALUE_TO_VARIABLE', {})
     tolerances = getattr(palette, 'TOLERANCES', {})
     
-    spacing_props = [
-        'margin', 'margin-top', 'margin-right', 'margin-bottom', 'margin-left',
-        'padding', 'padding-top', 'padding-right', 'padding-bottom', 'padding-left',
-        'gap', 'row-gap', 'column-gap'
-    ]
+    # Bind hot lookups to locals once per page
+    page_url = page_data.get('url', '')
+    pixel_match = PATTERNS['pixel_value'].match
+    find = find_variable_candidate
+    detect = detect_source_context
     
     for element in page_data.get('elements', []):
         styles = element.get('computed_styles', {})
+        if not styles or _SPACING_PROP_SET.isdisjoint(styles):
+            continue
+        styles_get = styles.get
         
-        for prop in spacing_props:
-            value = styles.get(prop)
-            if not value or value == '0px' or 'var(--' in value:
+        for prop in _SPACING_PROPS:
+            value = styles_get(prop)
+            if not value or value in _SKIP_SPACING or 'var(--' in value:
                 continue
             
-            candidate = find_variable_candidate(value, value_map, tolerances)
+            # Only pixel values can near-match; anything else needs an exact hit
+            if not pixel_match(value) and value.lower() not in value_map:
+                continue
+            
+            candidate = find(value, value_map, tolerances)
             
             if candidate:
-                source_context = detect_source_context(element)
+                source_context = detect(element)
                 
-                issues.append({
-                    'type': 'spacing',
-                    'page_url': page_data.get('url', ''),
-                    'element': element.get('tag', 'unknown'),
-                    'selector': element.get('selector', ''),
-                    'property': prop,
-                    'found_value': value,
-                    'expected_value': candidate['variable_name'],
-                    'variable_candidate': candidate['variable_name'],
-                    'source_context': source_context,
-                    'severity': 'low',
-                    'notes': f"Spacing should use variable: {candidate['variable_name']}"
-                })
+                issues.append(Issue(
+                    type=TYPE_SPACING,
+                    page_url=page_url,
+                    element=element.get('tag', 'unknown'),
+                    selector=element.get('selector', ''),
+                    property=prop,
+                    found_value=value,
+                    expected_value=candidate['variable_name'],
+                    variable_candidate=candidate['variable_name'],
+                    source_context=source_context,
+                    severity=SEV_LOW,
+                    notes=f"Spacing should use variable: {candidate['variable_name']}"
+                ))
                 
-                if verbose:
-                    print(f"  [SPACING] {element.get('selector')}: {prop}={value} → {candidate['variable_name']}")
+                _log.debug("  [SPACING] %s: %s=%s → %s", element.get('selector'), prop, value, candidate['variable_name'])
     
     return issues
 
@@ -400,57 +920,193 @@ def audit_images(page_data, palette, verbose=False):
     Args:
         page_data: Dict containing scraped page data
         palette: Loaded palette module (not heavily used for images)
-        verbose: Enable verbose logging
+        verbose: Unused; progress is logged at DEBUG (see configure_logging)
     
     Returns:
-        List of issue dicts
+        List of issue records
     """
     issues = []
     
     for image in page_data.get('images', []):
         # Check for missing alt text
         if not image.get('alt'):
-            issues.append({
-                'type': 'image',
-                'page_url': page_data.get('url', ''),
-                'image_url': image.get('src', ''),
-                'alt_text': '',
-                'issue_subtype': 'missing_alt',
-                'current_size': image.get('file_size', ''),
-                'recommended_size': '',
-                'dimensions': f"{image.get('width', '?')}x{image.get('height', '?')}",
-                'format': image.get('format', ''),
-                'severity': 'high',
-                'notes': 'Image missing alt text (accessibility issue)'
-            })
+            issues.append(ImageIssue(
+                type=TYPE_IMAGE,
+                page_url=page_data.get('url', ''),
+                image_url=image.get('src', ''),
+                alt_text='',
+                issue_subtype='missing_alt',
+                current_size=image.get('file_size', ''),
+                recommended_size='',
+                dimensions=f"{image.get('width', '?')}x{image.get('height', '?')}",
+                format=image.get('format', ''),
+                severity=SEV_HIGH,
+                notes='Image missing alt text (accessibility issue)'
+            ))
         
         # Check for oversized images
         file_size_kb = image.get('file_size_kb', 0)
         if file_size_kb > 500:
-            issues.append({
-                'type': 'image',
-                'page_url': page_data.get('url', ''),
-                'image_url': image.get('src', ''),
-                'alt_text': image.get('alt', ''),
-                'issue_subtype': 'oversized',
-                'current_size': f"{file_size_kb}KB",
-                'recommended_size': '< 500KB',
-                'dimensions': f"{image.get('width', '?')}x{image.get('height', '?')}",
-                'format': image.get('format', ''),
-                'severity': 'medium',
-                'notes': f'Image is {file_size_kb}KB, consider optimizing'
-            })
+            issues.append(ImageIssue(
+                type=TYPE_IMAGE,
+                page_url=page_data.get('url', ''),
+                image_url=image.get('src', ''),
+                alt_text=image.get('alt', ''),
+                issue_subtype='oversized',
+                current_size=f"{file_size_kb}KB",
+                recommended_size='< 500KB',
+                dimensions=f"{image.get('width', '?')}x{image.get('height', '?')}",
+                format=image.get('format', ''),
+                severity=SEV_MED,
+                notes=f'Image is {file_size_kb}KB, consider optimizing'
+            ))
         
-        if verbose and issues:
-            print(f"  [IMAGE] {image.get('src', 'unknown')}: {len(issues)} issue(s)")
+        if issues:
+            _log.debug("  [IMAGE] %s: %d issue(s)", image.get('src', 'unknown'), len(issues))
     
     return issues
 
 
+# =============================================================================
+# CSV EXPORT
+# =============================================================================
+
+# Export columns: the style-issue fields first, then the ones only some
+# issue types carry (left blank for the rest)
+ISSUE_CSV_COLUMNS = (
+    'type', 'page_url', 'element', 'selector', 'property', 'found_value',
+    'expected_value', 'variable_candidate', 'match_type', 'source_context',
+    'severity', 'notes',
+    'font_weight', 'line_height',
+    'image_url', 'alt_text', 'issue_subtype', 'current_size',
+    'recommended_size', 'dimensions', 'format',
+)
+
+
+def iter_rows(issues):
+    """
+    Yield one row tuple per issue, in ISSUE_CSV_COLUMNS order.
+    
+    Args:
+        issues: Iterable of issue records
+    
+    Yields:
+        Tuple of column values ('' where the issue type lacks the field)
+    """
+    for issue in issues:
+        yield tuple(getattr(issue, column, '') for column in ISSUE_CSV_COLUMNS)
+
+
+def export_issues_csv(issues, path):
+    """
+    Write issue records to a CSV file.
+    
+    Rows are streamed from iter_rows() into a single writerows() call, so
+    no per-issue dict is built on the way out.
+    
+    Args:
+        issues: Iterable of issue records
+        path: Output file path
+    
+    Returns:
+        The path written
+    """
+    with open(path, 'w', newline='', encoding=CSV_ENCODING) as f:
+        writer = csv.writer(f, delimiter=CSV_DELIMITER)
+        writer.writerow(ISSUE_CSV_COLUMNS)
+        writer.writerows(iter_rows(issues))
+    
+    return path
+
+
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
 
+def configure_logging(verbose=False):
+    """
+    Set the audit log level once per run.
+    
+    Per-element progress is logged at DEBUG, so with verbose off the
+    messages are never formatted. If the application hasn't configured
+    logging, a plain stdout handler is attached so verbose output still
+    looks like it did when it was printed.
+    
+    Args:
+        verbose: Show per-element progress
+    """
+    _log.setLevel(logging.DEBUG if verbose else logging.INFO)
+    if not _log.hasHandlers():
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        _log.addHandler(handler)
+
+
+_PAGE_AUDITS = (
+    ('colors', audit_colors),
+    ('fonts', audit_fonts),
+    ('spacing', audit_spacing),
+    ('images', audit_images),
+)
+
+
+def audit_page(page_data, palette, audit_types, verbose=False):
+    """
+    Run the requested audits against a single page.
+    
+    Args:
+        page_data: Dict containing scraped page data
+        palette: Loaded palette module
+        audit_types: List of audit types to run ('colors', 'fonts', 'spacing', 'images')
+        verbose: Unused; progress is logged at DEBUG (see configure_logging)
+    
+    Returns:
+        List of issue records, in audit type order
+    """
+    _log.debug("\nAuditing: %s", page_data.get('url', ''))
+    
+    issues = []
+    for audit_type, audit_fn in _PAGE_AUDITS:
+        if audit_type in audit_types:
+            issues.extend(audit_fn(page_data, palette, verbose))
+    return issues
+
+
+def audit_site(pages_data, palette, audit_types, verbose=False, max_workers=1):
+    """
+    Audit every page and flatten the issues.
+    
+    Pages run one after another by default. The audits are pure-Python work
+    on already-scraped data and hold the GIL throughout, so worker threads
+    only add overhead; max_workers > 1 is for audits that come to wait on
+    I/O. Results are collected in page order either way, and no rate
+    limiting is applied, as no requests are made.
+    
+    Args:
+        pages_data: List of scraped page data dicts
+        palette: Loaded palette module
+        audit_types: List of audit types to run ('colors', 'fonts', 'spacing', 'images')
+        verbose: Unused; progress is logged at DEBUG (see configure_logging)
+        max_workers: Thread count (default 1, sequential; capped at page count)
+    
+    Returns:
+        List of issue records across all pages
+    """
+    pages_data = list(pages_data)
+    workers = min(max_workers or 1, len(pages_data))
+    
+    if workers <= 1:
+        page_issues = [audit_page(page_data, palette, audit_types, verbose) for page_data in pages_data]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            page_issues = list(executor.map(
+                lambda page_data: audit_page(page_data, palette, audit_types, verbose),
+                pages_data
+            ))
+    
+    return [issue for issues in page_issues for issue in issues]
+
+
 def run_audit(url, palette, audit_types, verbose=False, site_config=None):
     """
     Main entry point for running design audits.
@@ -466,6 +1122,7 @@ def run_audit(url, palette, audit_types, verbose=False, site_config=None):
         Dict containing all audit results
     """
     site_config = site_config or {}
+    configure_logging(verbose)
     
     results = {
         'url': url,
@@ -475,7 +1132,7 @@ def run_audit(url, palette, audit_types, verbose=False, site_config=None):
         'summary': {
             'total_issues': 0,
             'by_type': {},
-            'by_severity': {'high': 0, 'medium': 0, 'low': 0},
+            'by_severity': {SEV_HIGH: 0, SEV_MED: 0, SEV_LOW: 0},
             'by_source_context': {}
         }
     }
@@ -485,38 +1142,23 @@ def run_audit(url, palette, audit_types, verbose=False, site_config=None):
         from core.page_scraper import scrape_site
         pages_data = scrape_site(url, site_config)
     except ImportError:
-        if verbose:
-            print("Note: page_scraper not available, using placeholder data")
+        _log.debug("Note: page_scraper not available, using placeholder data")
         # Placeholder for testing without scraper
         pages_data = [{'url': url, 'elements': [], 'images': []}]
     
     # Run requested audits on each page
-    for page_data in pages_data:
-        if verbose:
-            print(f"\nAuditing: {page_data.get('url', url)}")
-        
-        if 'colors' in audit_types:
-            results['issues'].extend(audit_colors(page_data, palette, verbose))
-        
-        if 'fonts' in audit_types:
-            results['issues'].extend(audit_fonts(page_data, palette, verbose))
-        
-        if 'spacing' in audit_types:
-            results['issues'].extend(audit_spacing(page_data, palette, verbose))
-        
-        if 'images' in audit_types:
-            results['issues'].extend(audit_images(page_data, palette, verbose))
+    results['issues'] = audit_site(pages_data, palette, audit_types, verbose)
     
     # Build summary
-    for issue in results['issues']:
-        issue_type = issue.get('type', 'unknown')
-        severity = issue.get('severity', 'medium')
-        source = issue.get('source_context', 'Unknown')
-        
-        results['summary']['by_type'][issue_type] = results['summary']['by_type'].get(issue_type, 0) + 1
-        results['summary']['by_severity'][severity] = results['summary']['by_severity'].get(severity, 0) + 1
-        results['summary']['by_source_context'][source] = results['summary']['by_source_context'].get(source, 0) + 1
+    issues = results['issues']
+    by_severity = Counter(results['summary']['by_severity'])
+    by_severity.update(issue.severity for issue in issues)
     
-    results['summary']['total_issues'] = len(results['issues'])
+    results['summary']['by_type'] = dict(Counter(issue.type for issue in issues))
+    results['summary']['by_severity'] = dict(by_severity)
+    results['summary']['by_source_context'] = dict(
+        Counter(getattr(issue, 'source_context', 'Unknown') for issue in issues)
+    )
+    results['summary']['total_issues'] = len(issues)
     
     return results
@@ -22,18 +22,63 @@ Date: January 2026
 
 import time
 import re
+import functools
 from urllib.parse import urlparse, urljoin, urlunparse
 from collections import deque
-from typing import Callable, List, Dict, Any, Set, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Set, Optional, Pattern, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
 
 # Import config with fallback
 try:
-    from config import USER_AGENT
+    from config import (
+        USER_AGENT, DEFAULT_CONCURRENCY, REQUEST_TIMEOUT, CONNECT_TIMEOUT, MAX_PAGE_BYTES,
+        HTTP_CACHE_NAME, HTTP_CACHE_EXPIRE
+    )
 except ImportError:
     USER_AGENT = "SiteAuditTool/1.0 (Web Design Audit)"
+    DEFAULT_CONCURRENCY = 4
+    REQUEST_TIMEOUT = 30
+    CONNECT_TIMEOUT = 5
+    MAX_PAGE_BYTES = 4 << 20
+    HTTP_CACHE_NAME = ".audit_cache"
+    HTTP_CACHE_EXPIRE = 3600
+
+# requests-cache is optional - only needed for use_cache=True
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Link extraction parses with lxml directly (no BeautifulSoup tree on top).
+# Pages are fed in as UTF-8 bytes so an XML encoding declaration in the
+# markup can't make lxml reject the str input.
+_LINK_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# Tracking query parameters. They don't affect page content but create
+# duplicate URLs, so _normalize_url strips them in one substitution.
+_TRACKING_RE = re.compile(
+    r"(?:^|&)(?:utm_source|utm_medium|utm_campaign|utm_content|utm_term|fbclid|gclid)=[^&]*"
+)
+
+# The same links turn up on most pages of a site, so parse each URL once
+_parse_cached = functools.lru_cache(maxsize=8192)(urlparse)
+
+# Common non-HTML resources. These won't have links to follow or styles to
+# audit. A tuple so str.endswith() can test them all in one call.
+SKIP_EXTENSIONS = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".avif",
+    ".mp4", ".mp3", ".wav", ".zip", ".rar", ".exe", ".dmg",
+    ".css", ".js", ".json", ".xml", ".txt", ".ico"
+)
+
+# With an audit pool, pages fetched but not yet audited keep their HTML in
+# memory; past this many, the crawl waits for the oldest audit to finish
+MAX_PENDING_AUDITS = 32
 
 
 class AuditEngine:
@@ -55,7 +100,10 @@ class AuditEngine:
         max_pages: int = 50,
         excluded_patterns: Optional[List[str]] = None,
         rate_limit: float = 0.5,
-        verbose: bool = False
+        verbose: bool = False,
+        excluded_re: Optional[Pattern] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_cache: bool = False
     ):
         """
         Initialize the audit engine.
@@ -66,12 +114,26 @@ class AuditEngine:
             excluded_patterns: List of regex patterns for URLs to skip
             rate_limit: Seconds to wait between requests (be nice to servers!)
             verbose: If True, print detailed progress information
+            excluded_re: Optional precompiled regex for URLs to skip
+                         (e.g. config.EXCLUDED_RE). Takes precedence over
+                         excluded_patterns when provided.
+            concurrency: Maximum pages fetched at once (1 = fully sequential)
+            use_cache: Keep fetched pages in an on-disk HTTP cache so repeat
+                       audits of the same site skip unchanged pages
+                       (requires requests-cache)
         """
         self.base_url = self._normalize_url(base_url)
         self.max_pages = max_pages
         self.excluded_patterns = excluded_patterns or []
+        
+        # Union the patterns into one regex up front so each URL is checked
+        # with a single search() instead of one per pattern
+        if excluded_re is None and self.excluded_patterns:
+            excluded_re = re.compile("|".join(f"(?:{p})" for p in self.excluded_patterns))
+        self.excluded_re = excluded_re
         self.rate_limit = rate_limit
         self.verbose = verbose
+        self.concurrency = max(1, concurrency)
         
         # Parse the base URL to extract the domain for restriction
         parsed = urlparse(self.base_url)
@@ -81,21 +143,81 @@ class AuditEngine:
         # Track visited URLs to avoid duplicates
         self.visited_urls: Set[str] = set()
         
-        # Queue of URLs to visit (breadth-first crawling)
+        # Queue of URLs to visit (breadth-first crawling), plus every link
+        # ever queued. Links are queued raw and only normalized when dequeued,
+        # so a non-canonical link ("/about/", "?utm_source=...") isn't in
+        # visited_urls; remembering it here keeps it from being queued again
+        # from every page that links to it.
         self.url_queue: deque = deque()
+        self.queued_urls: Set[str] = set()
         
         # Store results from all audited pages
         self.results: List[Dict[str, Any]] = []
         
+        # Set for the duration of run(): optional executor audits are sent
+        # to, the (url, future) audits in flight there in crawl order, and
+        # the hook each page's results are handed to once collected
+        self._audit_pool: Optional[Executor] = None
+        self._pending_audits: deque = deque()
+        self._on_results: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+        
         # Session for connection pooling (more efficient than individual requests)
-        self.session = requests.Session()
+        self.use_cache = use_cache
+        self.session = self._create_session(use_cache)
         self.session.headers.update({
-            "User-Agent": USER_AGENT
+            "User-Agent": USER_AGENT,
+            # gzip/deflate, plus br when a brotli package is installed
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
         })
+        
+        # Keep a pooled connection for every concurrent fetch, and retry
+        # transient gateway errors. After the retries run out the last
+        # response is returned as-is, so it's still reported as an HTTP error.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(10, self.concurrency),
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
-    def _normalize_url(self, url: str) -> str:
+    def _create_session(self, use_cache: bool) -> requests.Session:
+        """
+        Create the HTTP session, backed by a SQLite cache if requested.
+        
+        The cache honors ETag/Last-Modified, so once an entry expires an
+        unchanged page costs a 304 instead of a full download.
+        
+        Args:
+            use_cache: Whether to use the on-disk HTTP cache
+            
+        Returns:
+            A requests.Session (a requests_cache.CachedSession when caching)
+        """
+        if use_cache:
+            if requests_cache is not None:
+                return requests_cache.CachedSession(
+                    cache_name=HTTP_CACHE_NAME,
+                    backend="sqlite",
+                    expire_after=HTTP_CACHE_EXPIRE,
+                    allowable_methods=("GET",),
+                )
+            print("  [WARN] requests-cache not installed - running without HTTP cache")
+        
+        return requests.Session()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _normalize_url(url: str) -> str:
         """
         Normalize a URL to prevent duplicate crawling of the same page.
+        
+        Pure function of the URL, so results are cached.
 
         Normalization rules:
         - Remove trailing slashes (except for root)
@@ -141,11 +263,7 @@ class AuditEngine:
         # These don't affect page content but create duplicate URLs
         query = parsed.query
         if query:
-            # List of tracking params to remove
-            tracking_params = ["utm_source", "utm_medium", "utm_campaign", "utm_content", "utm_term", "fbclid", "gclid"]
-            params = query.split("&")
-            filtered_params = [p for p in params if not any(p.startswith(tp + "=") for tp in tracking_params)]
-            query = "&".join(filtered_params)
+            query = _TRACKING_RE.sub("", query).lstrip("&")
         
         # Reconstruct the normalized URL
         normalized = urlunparse((
@@ -179,7 +297,7 @@ class AuditEngine:
             return False
 
         try:
-            parsed = urlparse(url)
+            parsed = _parse_cached(url)
             
             # Must be HTTP or HTTPS
             if parsed.scheme not in ("http", "https"):
@@ -190,25 +308,16 @@ class AuditEngine:
                 return False
             
             # Check excluded patterns
-            for pattern in self.excluded_patterns:
-                if re.search(pattern, url):
-                    if self.verbose:
-                        print(f"  [SKIP] Excluded by pattern: {url}")
-                    return False
+            if self.excluded_re is not None and self.excluded_re.search(url):
+                if self.verbose:
+                    print(f"  [SKIP] Excluded by pattern: {url}")
+                return False
             
             # Skip common non-HTML resources
-            # These won't have links to follow or styles to audit
-            skip_extensions = [
-                ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".avif",
-                ".mp4", ".mp3", ".wav", ".zip", ".rar", ".exe", ".dmg",
-                ".css", ".js", ".json", ".xml", ".txt", ".ico"
-            ]
-            path_lower = parsed.path.lower()
-            for ext in skip_extensions:
-                if path_lower.endswith(ext):
-                    if self.verbose:
-                        print(f"  [SKIP] Non-HTML resource: {url}")
-                    return False
+            if parsed.path.lower().endswith(SKIP_EXTENSIONS):
+                if self.verbose:
+                    print(f"  [SKIP] Non-HTML resource: {url}")
+                return False
             
             return True
             
@@ -219,37 +328,46 @@ class AuditEngine:
     
     def _extract_links(self, html: str, current_url: str) -> List[str]:
         """
-        Extract all links from an HTML page.
+        Extract the crawlable links from an HTML page.
         
         Finds all <a href="..."> tags and converts relative URLs to absolute.
+        Off-site and file links that _is_valid_url would reject are dropped
+        here. Normalization is left until a URL is dequeued, so links that
+        never get crawled (past max_pages, or already seen) are never
+        normalized. _is_valid_url still runs on every URL before it's fetched.
         
         Args:
             html: The HTML content of the page
             current_url: The URL of the current page (for resolving relative links)
             
         Returns:
-            List of absolute URLs found on the page
+            List of absolute URLs (fragment removed) on the crawl's domain
         """
         links = []
+        allowed_domain = self.allowed_domain
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            doc = lxml.html.fromstring(html.encode("utf-8"), parser=_LINK_PARSER)
             
-            # Find all anchor tags with href attributes
-            for anchor in soup.find_all("a", href=True):
-                href = anchor["href"]
+            # Walk the <a> elements in C; no BeautifulSoup wrapper objects
+            for anchor in doc.iter("a"):
+                href = anchor.get("href")
                 
                 # Skip empty hrefs, javascript:, mailto:, tel:, etc.
                 if not href or href.startswith(("javascript:", "mailto:", "tel:", "#")):
                     continue
                 
-                # Convert relative URLs to absolute
-                absolute_url = urljoin(current_url, href)
+                # Convert relative URLs to absolute, minus any #fragment
+                absolute_url = urljoin(current_url, href).partition("#")[0]
                 
-                # Normalize the URL
-                normalized_url = self._normalize_url(absolute_url)
+                # Same scheme/domain/extension rules as _is_valid_url
+                parsed = _parse_cached(absolute_url)
+                if parsed.scheme not in ("http", "https") or parsed.netloc.lower() != allowed_domain:
+                    continue
+                if parsed.path.lower().endswith(SKIP_EXTENSIONS):
+                    continue
                 
-                links.append(normalized_url)
+                links.append(absolute_url)
                 
         except Exception as e:
             if self.verbose:
@@ -261,7 +379,9 @@ class AuditEngine:
         """
         Fetch the HTML content of a page.
         
-        Handles errors gracefully and respects rate limiting.
+        Handles errors gracefully and respects rate limiting. The body is
+        streamed, so non-HTML responses are dropped before download and
+        anything over MAX_PAGE_BYTES is abandoned partway through.
         
         Args:
             url: The URL to fetch
@@ -270,22 +390,41 @@ class AuditEngine:
             HTML content as string, or None if fetch failed
         """
         try:
-            response = self.session.get(url, timeout=30)
-            
-            # Check for successful response
-            if response.status_code != 200:
-                if self.verbose:
-                    print(f"  [WARN] HTTP {response.status_code} for {url}")
-                return None
-            
-            # Check content type - we only want HTML
-            content_type = response.headers.get("Content-Type", "")
-            if "text/html" not in content_type:
-                if self.verbose:
-                    print(f"  [SKIP] Non-HTML content type: {content_type}")
-                return None
-            
-            return response.text
+            with self.session.get(url, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT), stream=True) as response:
+                # Check for successful response
+                if response.status_code != 200:
+                    if self.verbose:
+                        print(f"  [WARN] HTTP {response.status_code} for {url}")
+                    return None
+                
+                # Check content type - we only want HTML
+                content_type = response.headers.get("Content-Type", "")
+                if "text/html" not in content_type:
+                    if self.verbose:
+                        print(f"  [SKIP] Non-HTML content type: {content_type}")
+                    return None
+                
+                # Reject oversized pages up front when the server says how big
+                # they are (the streamed read below still enforces the cap)
+                content_length = response.headers.get("Content-Length", "")
+                if content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+                    if self.verbose:
+                        print(f"  [SKIP] Page larger than {MAX_PAGE_BYTES} bytes: {url}")
+                    return None
+                
+                # Read (decompressed) body up to the cap
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    size += len(chunk)
+                    if size > MAX_PAGE_BYTES:
+                        if self.verbose:
+                            print(f"  [SKIP] Page larger than {MAX_PAGE_BYTES} bytes: {url}")
+                        return None
+                    chunks.append(chunk)
+                
+                # Same decoding as response.text, minus the charset sniffing
+                return b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
             
         except requests.exceptions.Timeout:
             if self.verbose:
@@ -297,13 +436,172 @@ class AuditEngine:
                 print(f"  [ERROR] Request failed for {url}: {e}")
             return None
     
-    def run(self, audit_callback: Callable[[str, str], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _fetch_page_staggered(self, url: str, slot: int) -> Optional[str]:
+        """
+        Fetch a page as part of a concurrent batch.
+        
+        Each request in a batch starts rate_limit seconds after the one
+        before it, so the server sees the same request rate as a sequential
+        crawl. Only the waiting on responses overlaps.
+        
+        Args:
+            url: The URL to fetch
+            slot: Position of this URL within its batch
+            
+        Returns:
+            HTML content as string, or None if fetch failed
+        """
+        if slot and self.rate_limit > 0:
+            time.sleep(slot * self.rate_limit)
+        return self._fetch_page(url)
+    
+    def _fetch_and_extract(self, url: str, slot: int) -> Tuple[Optional[str], List[str]]:
+        """
+        Fetch a page and pull its links, on a worker thread.
+        
+        lxml releases the GIL while it parses, so link extraction for one
+        page can overlap with other fetches and with the audit callback
+        running on the main thread.
+        
+        Args:
+            url: The URL to fetch
+            slot: Position of this URL within its batch
+            
+        Returns:
+            Tuple of (html or None, list of links found on the page)
+        """
+        html = self._fetch_page_staggered(url, slot)
+        if html is None:
+            return None, []
+        return html, self._extract_links(html, url)
+    
+    def _next_batch(self, size: int) -> List[str]:
+        """
+        Pop up to `size` unvisited, valid URLs off the queue.
+        
+        Queued links are raw absolute URLs; each is normalized here, then
+        checked against and added to the visited set. Popped links stay in
+        queued_urls, so they aren't queued again.
+        
+        Args:
+            size: Maximum number of URLs to return
+            
+        Returns:
+            List of URLs to fetch, in queue order
+        """
+        batch = []
+        while self.url_queue and len(batch) < size:
+            url = self._normalize_url(self.url_queue.popleft())
+            
+            # Skip if already visited
+            if url in self.visited_urls:
+                continue
+            
+            # Mark as visited
+            self.visited_urls.add(url)
+            
+            # Validate the URL
+            if not self._is_valid_url(url):
+                continue
+            
+            batch.append(url)
+        
+        return batch
+    
+    def _run_callback(self, audit_callback: Callable[[str, str], Dict[str, Any]], url: str, html: str) -> None:
+        """
+        Run the audit callback on one page and collect its results.
+        
+        Errors are reported and swallowed so one bad page doesn't stop the crawl.
+        
+        Args:
+            audit_callback: The audit function provided by the plugins
+            url: The page URL
+            html: The page HTML
+        """
+        try:
+            self._record_results(url, audit_callback(url, html))
+        except Exception as e:
+            self._report_audit_error(e)
+    
+    def _record_results(self, url: str, audit_result) -> None:
+        """
+        Tag one page's audit results with its URL and keep them.
+        
+        Args:
+            url: The page URL
+            audit_result: What the audit callback returned for the page
+        """
+        # Add the URL to the result for reference
+        if isinstance(audit_result, dict):
+            audit_result = [audit_result]
+        elif not isinstance(audit_result, list):
+            return
+        
+        # Some audits return multiple results per page
+        for result in audit_result:
+            result["url"] = url
+        self.results.extend(audit_result)
+        
+        if self._on_results is not None:
+            self._on_results(url, audit_result)
+    
+    def _report_audit_error(self, error: Exception) -> None:
+        """Report a failed page audit (with its traceback when verbose)."""
+        print(f"  [ERROR] Audit callback failed: {error}")
+        if self.verbose:
+            import traceback
+            traceback.print_exc()
+    
+    def _audit_page(self, audit_callback: Callable[[str, str], Dict[str, Any]], url: str, html: str) -> None:
+        """
+        Audit one crawled page, in this process or on the audit pool.
+        
+        Pool audits run while the crawl carries on; their results are
+        collected in crawl order by _collect_audits.
+        
+        Args:
+            audit_callback: The audit function provided by the plugins
+            url: The page URL
+            html: The page HTML
+        """
+        if self._audit_pool is None:
+            self._run_callback(audit_callback, url, html)
+            return
+        
+        self._pending_audits.append((url, self._audit_pool.submit(audit_callback, url, html)))
+        self._collect_audits(keep=MAX_PENDING_AUDITS)
+    
+    def _collect_audits(self, keep: int = 0) -> None:
+        """
+        Record pool audits that have finished, oldest first.
+        
+        Stops at the first one still running, unless more than `keep` are
+        in flight, in which case it waits for the oldest ones.
+        
+        Args:
+            keep: Number of audits that may be left in flight (0 = wait for all)
+        """
+        pending = self._pending_audits
+        while pending and (len(pending) > keep or pending[0][1].done()):
+            url, future = pending.popleft()
+            try:
+                self._record_results(url, future.result())
+            except Exception as e:
+                self._report_audit_error(e)
+    
+    def run(
+        self,
+        audit_callback: Callable[[str, str], Dict[str, Any]],
+        audit_pool: Optional[Executor] = None,
+        on_results: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Run the crawler with the provided audit callback.
         
         This is the main entry point for running an audit. The engine will:
         1. Start at the base URL
-        2. Fetch each page
+        2. Fetch pages in small concurrent batches (see concurrency)
         3. Call the audit_callback with the URL and HTML
         4. Extract links and add new URLs to the queue
         5. Continue until max_pages is reached or no more URLs
@@ -311,75 +609,69 @@ class AuditEngine:
         Args:
             audit_callback: A function that takes (url, html) and returns audit results.
                            This is provided by the audit plugins (design, SEO, content).
+            audit_pool: Optional executor (e.g. a ProcessPoolExecutor) to run
+                        audit_callback on, so parsing pages uses more than one
+                        core while the crawl continues. audit_callback must
+                        then be picklable. Results still come back in crawl order.
+            on_results: Optional function called with (url, results) as each
+                        page's results are collected, in this process
                            
         Returns:
             List of audit results from all crawled pages
         """
         # Initialize the queue with the base URL
         self.url_queue.append(self.base_url)
+        self.queued_urls.add(self.base_url)
         self.results = []
+        self._audit_pool = audit_pool
+        self._on_results = on_results
         pages_crawled = 0
         
         print(f"Starting crawl from: {self.base_url}")
         print(f"Max pages: {self.max_pages}")
         print("-" * 50)
         
-        while self.url_queue and pages_crawled < self.max_pages:
-            # Get the next URL from the queue
-            current_url = self.url_queue.popleft()
-            
-            # Skip if already visited
-            if current_url in self.visited_urls:
-                continue
-            
-            # Mark as visited
-            self.visited_urls.add(current_url)
-            
-            # Validate the URL
-            if not self._is_valid_url(current_url):
-                continue
-            
-            # Progress indicator
-            pages_crawled += 1
-            print(f"[{pages_crawled}/{self.max_pages}] Auditing: {current_url}")
-            
-            # Fetch the page
-            html = self._fetch_page(current_url)
-            
-            if html is None:
-                continue
-            
-            # Run the audit callback
-            try:
-                audit_result = audit_callback(current_url, html)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while self.url_queue and pages_crawled < self.max_pages:
+                # Pull the next batch of crawlable URLs off the queue
+                batch = self._next_batch(min(self.concurrency, self.max_pages - pages_crawled))
+                if not batch:
+                    continue
                 
-                # Add the URL to the result for reference
-                if isinstance(audit_result, dict):
-                    audit_result["url"] = current_url
-                    self.results.append(audit_result)
-                elif isinstance(audit_result, list):
-                    # Some audits return multiple results per page
-                    for result in audit_result:
-                        result["url"] = current_url
-                        self.results.append(result)
-                        
-            except Exception as e:
-                print(f"  [ERROR] Audit callback failed: {e}")
-                if self.verbose:
-                    import traceback
-                    traceback.print_exc()
-            
-            # Extract links for further crawling
-            links = self._extract_links(html, current_url)
-            
-            # Add new links to the queue
-            for link in links:
-                if link not in self.visited_urls and link not in self.url_queue:
-                    self.url_queue.append(link)
-            
-            # Rate limiting - be nice to the server
-            if self.rate_limit > 0:
-                time.sleep(self.rate_limit)
+                # Fetch and parse the batch concurrently; results come back in
+                # queue order. Request i starts at batch_start + i * rate_limit.
+                batch_start = time.monotonic()
+                pages = executor.map(self._fetch_and_extract, batch, range(len(batch)))
+                
+                for current_url, (html, links) in zip(batch, pages):
+                    # Progress indicator
+                    pages_crawled += 1
+                    print(f"[{pages_crawled}/{self.max_pages}] Auditing: {current_url}")
+                    
+                    if html is None:
+                        continue
+                    
+                    # Run the audit callback
+                    self._audit_page(audit_callback, current_url, html)
+                    
+                    # Add new links to the queue
+                    for link in links:
+                        if link not in self.visited_urls and link not in self.queued_urls:
+                            self.url_queue.append(link)
+                            self.queued_urls.add(link)
+                
+                # Rate limiting - be nice to the server. The gap is measured
+                # from the start of the batch's last request, so time already
+                # spent waiting on the response and auditing counts toward it.
+                if self.rate_limit > 0:
+                    last_start = batch_start + (len(batch) - 1) * self.rate_limit
+                    remaining = last_start + self.rate_limit - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
+        
+        # Wait for the audits still running on the pool
+        self._collect_audits()
+        self._audit_pool = self._on_results = None
         
         print("-" * 50)
         print(f"Crawl complete. Pages audited: {pages_crawled}")
@@ -397,3 +689,136 @@ class AuditEngine:
             List of all visited URLs
         """
         return list(self.visited_urls)
+
+
+class ScrapyAuditEngine(AuditEngine):
+    """
+    Alternative engine that runs the crawl on Scrapy (opt-in, for large sites).
+    
+    Scrapy's reactor overlaps many requests per domain and AutoThrottle
+    adjusts the delay to how fast the server is actually responding. URL
+    normalization, domain restriction, exclusions and result collection
+    are shared with AuditEngine, so reports look the same.
+    
+    Requires Scrapy (pip install scrapy). Scrapy's reactor can only be
+    started once per process, so run() can only be called once.
+    """
+    
+    def run(
+        self,
+        audit_callback: Callable[[str, str], Dict[str, Any]],
+        audit_pool: Optional[Executor] = None,
+        on_results: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the crawl on Scrapy with the provided audit callback.
+        
+        Args:
+            audit_callback: A function that takes (url, html) and returns audit results.
+            audit_pool: Optional executor to run audit_callback on (see AuditEngine.run)
+            on_results: Optional function called with (url, results) per page
+            
+        Returns:
+            List of audit results from all crawled pages
+        """
+        try:
+            import scrapy
+            from scrapy.crawler import CrawlerProcess
+            from scrapy.exceptions import CloseSpider
+        except ImportError:
+            raise ImportError("ScrapyAuditEngine requires Scrapy: pip install scrapy") from None
+        
+        engine = self
+        self.results = []
+        self._audit_pool = audit_pool
+        self._on_results = on_results
+        self.queued_urls.add(self.base_url)
+        pages_crawled = 0
+        
+        class AuditSpider(scrapy.Spider):
+            name = "site_audit"
+            start_urls = [engine.base_url]
+            
+            def parse(self, response):
+                nonlocal pages_crawled
+                current_url = engine._normalize_url(response.url)
+                
+                # Skip if already visited (e.g. reached through a redirect)
+                if current_url in engine.visited_urls or pages_crawled >= engine.max_pages:
+                    return
+                engine.visited_urls.add(current_url)
+                
+                # We only want HTML
+                if not isinstance(response, scrapy.http.HtmlResponse):
+                    if engine.verbose:
+                        print(f"  [SKIP] Non-HTML content type: {response.headers.get('Content-Type', b'').decode()}")
+                    return
+                
+                pages_crawled += 1
+                print(f"[{pages_crawled}/{engine.max_pages}] Auditing: {current_url}")
+                
+                engine._audit_page(audit_callback, current_url, response.text)
+                
+                # Only audited pages count toward max_pages (Scrapy's own
+                # CLOSESPIDER_PAGECOUNT would also count 404s, non-HTML and
+                # redirects to visited pages). Responses already in flight
+                # are dropped by the check above.
+                if pages_crawled >= engine.max_pages:
+                    raise CloseSpider("max_pages reached")
+                
+                # Follow links, with the same filtering as the simple engine
+                for href in response.css("a::attr(href)").getall():
+                    if not href or href.startswith(("javascript:", "mailto:", "tel:", "#")):
+                        continue
+                    
+                    link = engine._normalize_url(response.urljoin(href))
+                    if link in engine.visited_urls or link in engine.queued_urls:
+                        continue
+                    if not engine._is_valid_url(link):
+                        continue
+                    
+                    engine.queued_urls.add(link)
+                    yield scrapy.Request(link, callback=self.parse)
+        
+        process = CrawlerProcess(settings={
+            "USER_AGENT": USER_AGENT,
+            "ROBOTSTXT_OBEY": False,
+            "LOG_LEVEL": "INFO" if self.verbose else "WARNING",
+            
+            # Politeness: rate_limit is the starting delay; AutoThrottle
+            # backs off further if the server slows down
+            "DOWNLOAD_DELAY": self.rate_limit,
+            "CONCURRENT_REQUESTS_PER_DOMAIN": self.concurrency,
+            "AUTOTHROTTLE_ENABLED": True,
+            "AUTOTHROTTLE_START_DELAY": max(self.rate_limit, 0.1),
+            "AUTOTHROTTLE_TARGET_CONCURRENCY": float(self.concurrency),
+            
+            "DOWNLOAD_TIMEOUT": REQUEST_TIMEOUT,
+            "DOWNLOAD_MAXSIZE": MAX_PAGE_BYTES,
+            
+            # --cache maps onto Scrapy's own HTTP cache
+            "HTTPCACHE_ENABLED": self.use_cache,
+            "HTTPCACHE_DIR": HTTP_CACHE_NAME,
+            "HTTPCACHE_EXPIRATION_SECS": HTTP_CACHE_EXPIRE,
+            
+            # Breadth-first, like AuditEngine
+            "DEPTH_PRIORITY": 1,
+            "SCHEDULER_DISK_QUEUE": "scrapy.squeues.PickleFifoDiskQueue",
+            "SCHEDULER_MEMORY_QUEUE": "scrapy.squeues.FifoMemoryQueue",
+        })
+        
+        print(f"Starting crawl from: {self.base_url} (Scrapy engine)")
+        print(f"Max pages: {self.max_pages}")
+        print("-" * 50)
+        
+        process.crawl(AuditSpider)
+        process.start()
+        
+        self._collect_audits()
+        self._audit_pool = self._on_results = None
+        
+        print("-" * 50)
+        print(f"Crawl complete. Pages audited: {pages_crawled}")
+        print(f"Total results collected: {len(self.results)}")
+        
+        return self.results
@@ -21,6 +21,9 @@ Examples:
     # Audit staging site using production config
     python main.py https://staging.lastingchange.co --site ~/sites/lastingchange.co --all
 
+    # Re-run an audit, reusing cached pages from the last run
+    python main.py https://lastingchange.co --site ~/sites/lastingchange.co --all --cache
+
     # List all reports for a site
     python main.py --site ~/sites/lastingchange.co --list-reports
 
@@ -35,33 +38,219 @@ Date: January 2026
 """
 
 import argparse
+import functools
 import sys
 import os
 from datetime import datetime
 from typing import List, Dict, Any
 from urllib.parse import urlparse
 
-# Import core modules
-from engine import AuditEngine
-from config import DEFAULT_MAX_PAGES, DEFAULT_RATE_LIMIT, EXCLUDED_PATTERNS
-
-# Import plugins
-from plugins.audit_design import DesignAuditor
-from plugins.audit_seo import SEOAuditor
-from plugins.audit_content import ContentAuditor
+# Import core modules (the crawler engine and plugins are loaded lazily -
+# see LAZY LOADERS - so --help and the listing commands start fast)
+from config import DEFAULT_MAX_PAGES, DEFAULT_RATE_LIMIT, EXCLUDED_PATTERNS, EXCLUDED_RE
 
 # Import report generators (updated with site-specific directories)
 from reports.csv_export import (
     generate_all_reports,
     get_site_report_dir,
-    get_reports_base_dir
+    get_reports_base_dir,
+    ResultsLog
 )
 
 
+# Status markers the auditors prefix their "status" values with (interned,
+# as they're tested against every result in the summary tally)
+PASS_MARK = sys.intern("✅")
+WARN_MARK = sys.intern("⚠️")
+FAIL_MARK = sys.intern("❌")
+
+
+# ==============================================================================
+# LAZY LOADERS
+# ==============================================================================
+# Each plugin pulls in BeautifulSoup and its own helpers, so only import the
+# ones the requested audit type actually needs.
+
+def _load_design():
+    from plugins.audit_design import DesignAuditor
+    return DesignAuditor
+
+
+def _load_seo():
+    from plugins.audit_seo import SEOAuditor
+    return SEOAuditor
+
+
+def _load_content():
+    from plugins.audit_content import ContentAuditor
+    return ContentAuditor
+
+
+def _make_design_auditor(palette_module, palette_name, use_cache):
+    DesignAuditor = _load_design()
+
+    # Pass palette module or legacy palette name
+    if palette_module:
+        return DesignAuditor(palette_module=palette_module, use_cache=use_cache)
+    if palette_name:
+        return DesignAuditor(palette_name=palette_name, use_cache=use_cache)
+    return DesignAuditor(use_cache=use_cache)
+
+
+def _make_seo_auditor(palette_module, palette_name, use_cache):
+    return _load_seo()()
+
+
+def _make_content_auditor(palette_module, palette_name, use_cache):
+    return _load_content()()
+
+
+# Audit type -> (display name, factory(palette_module, palette_name, use_cache)),
+# in the order the auditors run on each page
+AUDITOR_FACTORIES = {
+    "design": ("Design Auditor", _make_design_auditor),
+    "seo": ("SEO Auditor", _make_seo_auditor),
+    "content": ("Content Auditor", _make_content_auditor),
+}
+
+
+def _make_audit_callback(auditors: Dict[str, Any], verbose: bool):
+    """
+    Build the per-page callback that runs every enabled auditor.
+    
+    Args:
+        auditors: Audit type -> auditor instance, in run order
+        verbose: Print per-auditor counts and tracebacks
+        
+    Returns:
+        combined_audit_callback(url, html) -> list of result dicts
+    """
+    # Bind each auditor's audit method once rather than per page
+    audit_fns = tuple((name, auditor.audit) for name, auditor in auditors.items())
+
+    # auditor name -> whether its results come back without a "type" key
+    tags_missing: Dict[str, bool] = {}
+
+    def combined_audit_callback(url: str, html: str) -> List[Dict[str, Any]]:
+        """
+        Run all enabled auditors on a page and combine results.
+
+        Args:
+            url: The URL being audited
+            html: The HTML content
+
+        Returns:
+            Combined list of audit results from all auditors
+        """
+        # The first auditor's list is adopted as the page's result list
+        # rather than copied, so single-auditor runs never copy at all
+        all_results = None
+
+        for auditor_name, audit in audit_fns:
+            try:
+                # Auditors always return a list of result dicts (see plugins)
+                results = audit(url, html)
+
+                # Tag each result with the auditor type. The built-in
+                # auditors always set it, so decide once per auditor from
+                # its first result and skip the per-result check after that.
+                if results:
+                    needs_tag = tags_missing.get(auditor_name)
+                    if needs_tag is None:
+                        needs_tag = tags_missing[auditor_name] = "type" not in results[0]
+                    if needs_tag:
+                        for result in results:
+                            if "type" not in result:
+                                result["type"] = auditor_name
+
+                if all_results is None:
+                    all_results = results
+                else:
+                    all_results.extend(results)
+
+                if verbose:
+                    print(f"    [{auditor_name}] Found {len(results)} items")
+
+            except Exception as e:
+                print(f"    [ERROR] {auditor_name} auditor failed: {e}")
+                if verbose:
+                    _print_traceback()
+
+        if all_results is None:
+            all_results = []
+
+        return all_results
+
+    return combined_audit_callback
+
+
+# ==============================================================================
+# AUDIT WORKER PROCESSES (--audit-processes)
+# ==============================================================================
+# Each worker builds its auditors once, in _init_audit_worker, and then
+# audits the pages the engine sends it. Only (url, html) and the results
+# cross the process boundary.
+
+_worker_audit = None
+
+
+def _init_audit_worker(kinds, palette_site, palette_name, use_cache, verbose):
+    """
+    Set up a worker process's auditors.
+    
+    Args:
+        kinds: Audit types to run (those that initialized in the main process)
+        palette_site: Site path to load palette.py from, or None
+        palette_name: Legacy palette name (--palette), or None
+        use_cache: Whether auditors may use on-disk caches (--cache)
+        verbose: Passed through to the audit callback
+    """
+    global _worker_audit
+    import contextlib
+    import io
+
+    # The main process has already shown anything the auditors print while
+    # initializing (palette warnings etc.), so don't repeat it per worker
+    with contextlib.redirect_stdout(io.StringIO()):
+        palette_module = load_site_palette(palette_site) if palette_site else None
+        auditors = {
+            kind: AUDITOR_FACTORIES[kind][1](palette_module, palette_name, use_cache)
+            for kind in kinds
+        }
+    _worker_audit = _make_audit_callback(auditors, verbose)
+
+
+def _audit_in_worker(url: str, html: str) -> List[Dict[str, Any]]:
+    """Audit one page in a worker process (see _init_audit_worker)."""
+    return _worker_audit(url, html)
+
+
+def _load_engine(name: str):
+    """Get the crawler engine class for --engine."""
+    from engine import AuditEngine, ScrapyAuditEngine
+    return ScrapyAuditEngine if name == "scrapy" else AuditEngine
+
+
 # ==============================================================================
 # UTILITY FUNCTIONS
 # ==============================================================================
 
+_traceback = None
+
+
+def _print_traceback():
+    """
+    Print the current exception's traceback (used under --verbose).
+
+    traceback (and the linecache/tokenize modules it pulls in) is only
+    imported the first time an error is actually reported.
+    """
+    global _traceback
+    if _traceback is None:
+        import traceback as _traceback
+    _traceback.print_exc()
+
+
 def get_site_name(url: str) -> str:
     """
     Extract a clean site name from a URL for display purposes.
@@ -107,16 +296,19 @@ def list_site_reports(url: str = None, site_path: str = None) -> List[str]:
     if not os.path.exists(site_dir):
         return []
 
-    reports = []
-    for file in os.listdir(site_dir):
-        if file.startswith("audit_") or file.endswith(".csv"):
-            filepath = os.path.join(site_dir, file)
-            reports.append(filepath)
+    # scandir's DirEntry caches stat info, so sorting by mtime doesn't need
+    # a second stat() per file
+    with os.scandir(site_dir) as it:
+        entries = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in it
+            if entry.name.startswith("audit_") or entry.name.endswith(".csv")
+        ]
 
     # Sort by modification time, newest first
-    reports.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    entries.sort(key=lambda entry: entry[0], reverse=True)
 
-    return reports
+    return [path for _, path in entries]
 
 
 def list_all_sites(base_sites_dir: str = None) -> List[str]:
@@ -212,48 +404,67 @@ def print_reports_summary(url: str = None, site_path: str = None):
         print("  python main.py --site ~/sites/example.com --list-reports")
 
 
+def _palette_module_name(palette_path: str) -> str:
+    """Name a site's palette module is registered under in sys.modules."""
+    import hashlib
+    return "site_palette_" + hashlib.sha1(palette_path.encode("utf-8")).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=32)
 def load_site_palette(site_path: str):
     """
     Dynamically load palette.py from a site directory.
 
+    Results are cached per site path (main() canonicalizes it with
+    os.path.realpath first); use reload_site_palettes() to pick up edits.
+
     Args:
         site_path: Path to the site directory containing palette.py
 
     Returns:
         The loaded palette module, or None if not found
     """
-    palette_path = os.path.join(site_path, 'palette.py')
+    palette_path = os.path.realpath(os.path.join(site_path, 'palette.py'))
     
     if not os.path.exists(palette_path):
         print(f"⚠️ No palette.py found at {palette_path}")
         return None
     
+    # Register each palette under a name derived from its path, so loading
+    # the same palette again (or from another module) is a sys.modules hit
+    # rather than a re-exec. The file loader reads/writes __pycache__ as
+    # for any import, so re-runs skip recompiling it.
+    module_name = _palette_module_name(palette_path)
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    
     import importlib.util
-    spec = importlib.util.spec_from_file_location("palette", palette_path)
+    spec = importlib.util.spec_from_file_location(module_name, palette_path)
     palette_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(palette_module)
+    sys.modules[module_name] = palette_module
+    try:
+        spec.loader.exec_module(palette_module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
     
     return palette_module
 
 
-# ==============================================================================
-# MAIN FUNCTION
-# ==============================================================================
-
-def main():
+def reload_site_palettes():
     """
-    Main entry point for the Unified Audit Tool.
-    Parses command-line arguments and runs the appropriate audits.
+    Forget every loaded site palette so the next load re-reads palette.py.
     """
+    load_site_palette.cache_clear()
+    for module_name in [name for name in sys.modules if name.startswith("site_palette_")]:
+        del sys.modules[module_name]
 
-    # =========================================================================
-    # ARGUMENT PARSING
-    # =========================================================================
 
-    parser = argparse.ArgumentParser(
-        description="Unified Audit Tool - Crawl and audit websites for design, SEO, and content issues.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# ==============================================================================
+# MAIN FUNCTION
+# ==============================================================================
+
+_HELP_EPILOG = """
 Examples:
   python main.py https://lastingchange.co --site ~/sites/lastingchange.co --all
   python main.py https://lastingchange.co --site ~/sites/lastingchange.co --type design
@@ -263,6 +474,36 @@ Examples:
 
 Reports are saved to: <site_path>/reports/
         """
+
+
+def _build_full_parser(with_help: bool = True) -> argparse.ArgumentParser:
+    """
+    Build the argument parser for a full audit run.
+
+    Only called once the listing commands have been ruled out, so
+    --list-sites / --list-reports never construct it.
+
+    Args:
+        with_help: Whether the parser may be asked to print full help. If
+                   not, the examples epilog is left out and a fixed-width
+                   formatter is used - argparse builds a formatter for
+                   every add_argument call, and the default one queries
+                   the terminal size each time.
+
+    Returns:
+        The configured ArgumentParser
+    """
+    if with_help:
+        formatter_class = argparse.RawDescriptionHelpFormatter
+        epilog = _HELP_EPILOG
+    else:
+        formatter_class = functools.partial(argparse.HelpFormatter, width=80)
+        epilog = None
+
+    parser = argparse.ArgumentParser(
+        description="Unified Audit Tool - Crawl and audit websites for design, SEO, and content issues.",
+        formatter_class=formatter_class,
+        epilog=epilog
     )
 
     # URL argument (optional if just listing)
@@ -316,11 +557,38 @@ Reports are saved to: <site_path>/reports/
         help=f"Seconds between requests (default: {DEFAULT_RATE_LIMIT})"
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache fetched pages and stylesheets on disk so repeat audits skip unchanged ones (requires requests-cache)"
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=["simple", "scrapy"],
+        default="simple",
+        help="Crawler engine: simple (default) or scrapy for large sites (requires scrapy)"
+    )
+
+    parser.add_argument(
+        "--audit-processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Audit pages in N worker processes while the crawl continues (default: 0, audit in the main process)"
+    )
+
+    parser.add_argument(
+        "--reload-palette",
+        action="store_true",
+        help="Re-read palette.py instead of reusing a palette already loaded in this process"
+    )
+
     # Output options
     parser.add_argument(
         "--output", "-o",
         default=None,
-        help="Custom output filename (without extension). Default: auto-generated with timestamp"
+        help="Custom name used in place of the timestamp in report filenames. Default: timestamp"
     )
 
     parser.add_argument(
@@ -350,16 +618,75 @@ Reports are saved to: <site_path>/reports/
         help="Enable verbose output"
     )
 
+    return parser
+
+
+def _run_listing_command(argv: List[str]):
+    """
+    Handle --list-sites / --list-reports without building the full parser.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Exit code if a listing command was handled, otherwise None
+    """
+    # Leave --help to the full parser so it documents every option
+    if "-h" in argv or "--help" in argv:
+        return None
+
+    if "--list-sites" in argv:
+        print_reports_summary()
+        return 0
+
+    if "--list-reports" in argv or "-l" in argv:
+        # Only the URL and --site matter for listing; ignore everything else
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("url", nargs="?", default=None)
+        parser.add_argument("--site", "-s", default=None)
+        args, _ = parser.parse_known_args(argv)
+
+        site = os.path.expanduser(args.site) if args.site else None
+        print_reports_summary(args.url, site)
+        return 0
+
+    return None
+
+
+def main():
+    """
+    Main entry point for the Unified Audit Tool.
+    Parses command-line arguments and runs the appropriate audits.
+    """
+
+    # =========================================================================
+    # HANDLE LISTING COMMANDS (before building the full parser)
+    # =========================================================================
+
+    exit_code = _run_listing_command(sys.argv[1:])
+    if exit_code is not None:
+        return exit_code
+
+    # =========================================================================
+    # ARGUMENT PARSING
+    # =========================================================================
+
+    argv = sys.argv[1:]
+    parser = _build_full_parser(with_help="-h" in argv or "--help" in argv)
+
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle --all flag
     if args.all:
         args.type = "all"
 
-    # Expand ~ in site path
+    enabled = set(AUDITOR_FACTORIES) if args.type == "all" else {args.type}
+
+    # Expand ~ and resolve symlinks once, so the site path is a canonical
+    # cache key for load_site_palette
     if args.site:
-        args.site = os.path.expanduser(args.site)
+        args.site = os.path.realpath(os.path.expanduser(args.site))
 
     # =========================================================================
     # HANDLE LISTING COMMANDS
@@ -378,18 +705,23 @@ Reports are saved to: <site_path>/reports/
     # =========================================================================
 
     if not args.url:
-        parser.print_help()
+        _build_full_parser().print_help()
         print("\n❌ Error: URL is required to run an audit.")
         print("   Example: python main.py https://lastingchange.co --site ~/sites/lastingchange.co --all")
         return 1
 
     if not args.site:
-        parser.print_help()
+        _build_full_parser().print_help()
         print("\n❌ Error: --site is required to specify where to find palette.py and save reports.")
         print("   Example: python main.py https://lastingchange.co --site ~/sites/lastingchange.co --all")
         return 1
 
-    if not os.path.exists(args.site):
+    # One directory read tells us both that the site exists and which of
+    # palette.py / reports/ are already there, without a stat per file
+    try:
+        with os.scandir(args.site) as it:
+            site_entries = {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
         print(f"\n❌ Error: Site directory does not exist: {args.site}")
         print("   Create it with: mkdir -p " + args.site)
         return 1
@@ -403,32 +735,46 @@ Reports are saved to: <site_path>/reports/
     # =========================================================================
 
     site_name = get_site_name(args.url)
-    report_dir = get_site_report_dir(args.url, args.site)
-
-    print("=" * 60)
-    print("UNIFIED AUDIT TOOL")
-    print("=" * 60)
-    print(f"Target URL:  {args.url}")
-    print(f"Site Name:   {site_name}")
-    print(f"Site Path:   {args.site}")
-    print(f"Audit Type:  {args.type}")
-    print(f"Max Pages:   {args.max_pages}")
-    print(f"Rate Limit:  {args.rate_limit}s")
-    print(f"Output Dir:  {report_dir}")
-    print("=" * 60)
-    print()
+    if "reports" in site_entries:
+        report_dir = get_reports_base_dir(args.url, args.site)
+    else:
+        report_dir = get_site_report_dir(args.url, args.site)
+
+    # Banners are assembled and written in one go rather than a print() per
+    # line, which matters when stdout is a pipe or a CI log file
+    banner = [
+        "=" * 60,
+        "UNIFIED AUDIT TOOL",
+        "=" * 60,
+        f"Target URL:  {args.url}",
+        f"Site Name:   {site_name}",
+        f"Site Path:   {args.site}",
+        f"Audit Type:  {args.type}",
+        f"Max Pages:   {args.max_pages}",
+        f"Rate Limit:  {args.rate_limit}s",
+        f"Output Dir:  {report_dir}",
+        "=" * 60,
+        "",
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
 
     # =========================================================================
     # LOAD SITE PALETTE
     # =========================================================================
 
     palette_module = None
-    if args.type in ["design", "all"]:
-        palette_module = load_site_palette(args.site)
-        if palette_module:
-            print(f"✓ Loaded palette from {args.site}/palette.py")
-        elif args.palette:
+    if args.reload_palette:
+        reload_site_palettes()
+    if "design" in enabled:
+        if args.palette:
+            # --palette overrides palette.py, so don't read it at all
             print(f"  Using legacy palette: {args.palette}")
+        elif "palette.py" in site_entries:
+            palette_module = load_site_palette(args.site)
+            if palette_module:
+                print(f"✓ Loaded palette from {args.site}/palette.py")
+        else:
+            print(f"⚠️ No palette.py found at {os.path.join(args.site, 'palette.py')}")
 
     # =========================================================================
     # INITIALIZE AUDITORS
@@ -436,35 +782,16 @@ Reports are saved to: <site_path>/reports/
 
     auditors = {}
 
-    if args.type in ["design", "all"]:
+    for kind, (label, factory) in AUDITOR_FACTORIES.items():
+        if kind not in enabled:
+            continue
         try:
-            # Pass palette module or legacy palette name
-            if palette_module:
-                auditors["design"] = DesignAuditor(palette_module=palette_module)
-            elif args.palette:
-                auditors["design"] = DesignAuditor(palette_name=args.palette)
-            else:
-                auditors["design"] = DesignAuditor()
-            print("✓ Design Auditor initialized")
+            auditors[kind] = factory(palette_module, args.palette, args.cache)
+            print(f"✓ {label} initialized")
         except Exception as e:
-            print(f"⚠️ Design Auditor failed to initialize: {e}")
+            print(f"⚠️ {label} failed to initialize: {e}")
             if args.verbose:
-                import traceback
-                traceback.print_exc()
-
-    if args.type in ["seo", "all"]:
-        try:
-            auditors["seo"] = SEOAuditor()
-            print("✓ SEO Auditor initialized")
-        except Exception as e:
-            print(f"⚠️ SEO Auditor failed to initialize: {e}")
-
-    if args.type in ["content", "all"]:
-        try:
-            auditors["content"] = ContentAuditor()
-            print("✓ Content Auditor initialized")
-        except Exception as e:
-            print(f"⚠️ Content Auditor failed to initialize: {e}")
+                _print_traceback()
 
     if not auditors:
         print("\n❌ No auditors could be initialized. Check your plugins directory.")
@@ -476,63 +803,56 @@ Reports are saved to: <site_path>/reports/
     # CREATE COMBINED AUDIT CALLBACK
     # =========================================================================
 
-    def combined_audit_callback(url: str, html: str) -> List[Dict[str, Any]]:
-        """
-        Run all enabled auditors on a page and combine results.
-
-        Args:
-            url: The URL being audited
-            html: The HTML content
-
-        Returns:
-            Combined list of audit results from all auditors
-        """
-        all_results = []
-
-        for auditor_name, auditor in auditors.items():
-            try:
-                results = auditor.audit(url, html)
-
-                # Handle both single dict and list of dicts
-                if isinstance(results, dict):
-                    results = [results]
-
-                # Tag each result with the auditor type
-                for result in results:
-                    if "type" not in result:
-                        result["type"] = auditor_name
-
-                all_results.extend(results)
-
-                if args.verbose:
-                    print(f"    [{auditor_name}] Found {len(results)} items")
-
-            except Exception as e:
-                print(f"    [ERROR] {auditor_name} auditor failed: {e}")
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc()
-
-        return all_results
+    # With --audit-processes, pages are audited in worker processes that
+    # each build their own auditors; the closure can't be sent to them
+    audit_pool = None
+    if args.audit_processes > 0:
+        from concurrent.futures import ProcessPoolExecutor
+        audit_pool = ProcessPoolExecutor(
+            max_workers=args.audit_processes,
+            initializer=_init_audit_worker,
+            initargs=(tuple(auditors), args.site if palette_module else None,
+                      args.palette, args.cache, args.verbose),
+        )
+        audit_callback = _audit_in_worker
+        print(f"✓ Auditing pages in {args.audit_processes} worker processes")
+        print()
+    else:
+        audit_callback = _make_audit_callback(auditors, args.verbose)
 
     # =========================================================================
     # RUN CRAWLER
     # =========================================================================
 
-    engine = AuditEngine(
+    engine_class = _load_engine(args.engine)
+    engine = engine_class(
         base_url=args.url,
         max_pages=args.max_pages,
         excluded_patterns=EXCLUDED_PATTERNS,
+        excluded_re=EXCLUDED_RE,
         rate_limit=args.rate_limit,
-        verbose=args.verbose
+        verbose=args.verbose,
+        use_cache=args.cache
     )
 
     print("Starting crawl...")
     print()
 
-    results = engine.run(combined_audit_callback)
+    # Each page's rows are streamed to a CSV as they're collected, unless
+    # only the HTML report was asked for
+    results_log = None if args.format == "html" else ResultsLog(report_dir, args.output)
+    try:
+        results = engine.run(audit_callback, audit_pool=audit_pool,
+                             on_results=results_log.write if results_log is not None else None)
+    finally:
+        if results_log is not None:
+            results_log.close()
+        if audit_pool is not None:
+            audit_pool.shutdown()
 
     print()
+    if results_log is not None and results_log.rows_written:
+        print(f"✓ Streamed {results_log.rows_written} results to {os.path.basename(results_log.filepath)}")
 
     # =========================================================================
     # GENERATE REPORTS
@@ -552,7 +872,9 @@ Reports are saved to: <site_path>/reports/
     generated_files = generate_all_reports(
         results=results,
         url=args.url,
-        site_path=args.site
+        site_path=args.site,
+        formats=args.format,
+        run_tag=args.output
     )
 
     print()
@@ -561,43 +883,59 @@ Reports are saved to: <site_path>/reports/
     # SUMMARY
     # =========================================================================
 
-    print("=" * 60)
-    print("AUDIT COMPLETE")
-    print("=" * 60)
-
-    # Print statistics
+    # One pass over the results; a status carries at most one marker
     total = len(results)
-    passed = sum(1 for r in results if "✅" in str(r.get("status", "")))
-    warnings = sum(1 for r in results if "⚠️" in str(r.get("status", "")))
-    failed = sum(1 for r in results if "❌" in str(r.get("status", "")))
-
-    print(f"Total items checked: {total}")
-    print(f"  ✅ Passed:   {passed}")
-    print(f"  ⚠️  Warnings: {warnings}")
-    print(f"  ❌ Failed:   {failed}")
-    print()
-    print(f"Pass rate: {(passed/total*100):.1f}%" if total > 0 else "N/A")
-    print()
-
-    # Print generated file locations
-    print("📁 Reports saved to:")
+    passed = warnings = failed = 0
+    pass_mark, warn_mark, fail_mark = PASS_MARK, WARN_MARK, FAIL_MARK
+    for r in results:
+        status = r.get("status")
+        if not isinstance(status, str):
+            continue
+        if pass_mark in status:
+            passed += 1
+        elif warn_mark in status:
+            warnings += 1
+        elif fail_mark in status:
+            failed += 1
+    pass_rate = f"{passed * 100.0 / total:.1f}%" if total else "N/A"
+
+    summary = [
+        "=" * 60,
+        "AUDIT COMPLETE",
+        "=" * 60,
+        f"Total items checked: {total}",
+        f"  ✅ Passed:   {passed}",
+        f"  ⚠️  Warnings: {warnings}",
+        f"  ❌ Failed:   {failed}",
+        "",
+        f"Pass rate: {pass_rate}",
+        "",
+    ]
+
+    # Generated file locations
+    summary.append("📁 Reports saved to:")
     if isinstance(generated_files, dict):
         output_dir = generated_files.get('output_dir', '')
         all_files = generated_files.get('all_files', [])
         if all_files:
-            for filepath in all_files:
-                print(f"   {os.path.basename(filepath)}")
-            print(f"\n   Directory: {output_dir}")
+            # Report paths are built with os.path.join, so os.sep is the
+            # only separator in them
+            sep = os.sep
+            summary.extend([f"   {filepath.rpartition(sep)[2]}" for filepath in all_files])
+            summary.append(f"\n   Directory: {output_dir}")
         else:
-            print(f"   {generated_files.get('summary', 'No files generated')}")
+            summary.append(f"   {generated_files.get('summary') or generated_files.get('html', 'No files generated')}")
     else:
         # Legacy: single path string
-        print(f"   {generated_files}")
-
-    print()
-    print(f"To list all reports for this site:")
-    print(f"   python main.py --site {args.site} --list-reports")
-    print()
+        summary.append(f"   {generated_files}")
+
+    summary += [
+        "",
+        "To list all reports for this site:",
+        f"   python main.py --site {args.site} --list-reports",
+        "",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
     return 0
 
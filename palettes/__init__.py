@@ -8,24 +8,42 @@ Available palettes:
     - lasting_change: LASTING CHANGE executive coaching website
 """
 
-# Import the default palette for convenience
-try:
-    from palettes.lasting_change import (
-        BRAND_COLORS,
-        BRAND_GRADIENTS,
-        APPROVED_TEXTURES,
-        APPROVED_BLEND_MODES,
-        TEXTURE_OPACITY_RANGE,
-        SECTION_RULES,
-        get_color_name,
-        get_section_rules,
-        is_approved_color,
-        is_approved_texture,
-        get_all_approved_hex_codes,
-    )
-except ImportError:
-    # Palette file not yet created
-    pass
+# The default palette's names are re-exported here for convenience, but the
+# module is only imported when one of them is first accessed (PEP 562), so
+# SEO/content-only runs never load it.
+_EXPORTS = {
+    "BRAND_COLORS",
+    "BRAND_GRADIENTS",
+    "APPROVED_TEXTURES",
+    "APPROVED_BLEND_MODES",
+    "TEXTURE_OPACITY_RANGE",
+    "SECTION_RULES",
+    "get_color_name",
+    "get_section_rules",
+    "is_approved_color",
+    "is_approved_texture",
+    "get_all_approved_hex_codes",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        try:
+            from palettes import lasting_change as _palette
+        except ImportError:
+            # Palette file not yet created
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        
+        value = getattr(_palette, name)
+        globals()[name] = value
+        return value
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _EXPORTS)
+
 
 __all__ = [
     "BRAND_COLORS",
@@ -5,22 +5,39 @@ Each plugin handles a specific type of audit:
     - DesignAuditor: Colors, textures, blend modes, opacity
     - SEOAuditor: Meta tags, headings, Open Graph, Twitter Cards
     - ContentAuditor: Text extraction, word counts, placeholder detection
+
+Every auditor exposes audit(url, html), which always returns a list of
+result dicts (empty if there is nothing to report), never a bare dict.
 """
 
-try:
-    from plugins.audit_design import DesignAuditor
-except ImportError:
-    DesignAuditor = None
+import importlib
+
+# Auditors are imported on first access (PEP 562), so importing one plugin
+# submodule - or just the package - doesn't load the other two and their
+# dependencies. A plugin that fails to import resolves to None, as before.
+_LAZY = {
+    "DesignAuditor": "plugins.audit_design",
+    "SEOAuditor": "plugins.audit_seo",
+    "ContentAuditor": "plugins.audit_content",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        obj = getattr(importlib.import_module(_LAZY[name]), name)
+    except ImportError:
+        obj = None
+    
+    globals()[name] = obj
+    return obj
+
 
-try:
-    from plugins.audit_seo import SEOAuditor
-except ImportError:
-    SEOAuditor = None
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-try:
-    from plugins.audit_content import ContentAuditor
-except ImportError:
-    ContentAuditor = None
 
 __all__ = [
     "DesignAuditor",
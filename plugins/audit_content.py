@@ -28,7 +28,12 @@ Date: January 2026
 
 import re
 from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+try:
+    from bs4.builder import LXMLTreeBuilder
+except ImportError:
+    LXMLTreeBuilder = None
 
 # Import configuration
 from config import (
@@ -39,6 +44,141 @@ from config import (
     STATUS_MISSING,
 )
 
+# google-re2 is optional. Its matching is linear in the text, so a ".*"
+# placeholder pattern can't backtrack its way across a large page the way
+# it can with re. RE2 has no backreferences or lookaround; a pattern that
+# needs them is compiled with re instead.
+try:
+    import re2 as _placeholder_re
+except ImportError:
+    _placeholder_re = re
+
+
+# ==============================================================================
+# PAGE WALK CLASSIFICATION
+# ==============================================================================
+
+HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+LIST_TAGS = frozenset(["ul", "ol"])
+SECTION_TAGS = frozenset(["section", "article", "main"])
+
+# Elements whose classes are reported as a result's parent context
+CONTEXT_TAGS = frozenset(["section", "div", "article"])
+
+# Class keywords marking a button/link as a CTA, or a div as a section
+CTA_CLASS_KEYWORDS = ["btn", "button", "cta", "action"]
+SECTION_CLASS_KEYWORDS = ["section", "block", "container", "wrapper", "hero", "footer", "header"]
+
+# Link text that marks a plain <a> as a CTA
+CTA_TEXT_KEYWORDS = ["contact", "get started", "learn more", "find out", "sign up", "subscribe"]
+
+# Each keyword list as one alternation, matched against lowercased text.
+# (Lowercasing first and compiling without IGNORECASE keeps re's fast
+# scan; it's about twice as quick as any() over the substrings.)
+CTA_CLASS_RE = re.compile("|".join(map(re.escape, CTA_CLASS_KEYWORDS)))
+SECTION_CLASS_RE = re.compile("|".join(map(re.escape, SECTION_CLASS_KEYWORDS)))
+CTA_TEXT_RE = re.compile("|".join(map(re.escape, CTA_TEXT_KEYWORDS)))
+
+# String types get_text() counts for section/article/main/div elements
+_TEXT_TYPES = (NavigableString, CData)
+
+# Stack markers: the walk has finished a section's / context element's subtree
+_LEAVE_SECTION = object()
+_LEAVE_CONTEXT = object()
+
+
+
+if LXMLTreeBuilder is not None:
+    class _SkippingTreeBuilder(LXMLTreeBuilder):
+        """
+        BeautifulSoup's lxml builder, minus the subtrees of ignored tags.
+        
+        lxml reports balanced start/end events, so a depth counter is enough
+        to drop every event inside an ignored element before BeautifulSoup
+        builds a Tag or string for it. The text on either side is flushed as
+        separate strings, exactly as if the element had been decompose()d.
+        """
+        
+        def __init__(self, skip_tags, **kwargs):
+            super().__init__(**kwargs)
+            self.skip_tags = frozenset(skip_tags)
+            self._skip_depth = 0
+        
+        def start(self, tag, attrib, nsmap={}):
+            if self._skip_depth:
+                self._skip_depth += 1
+            elif tag in self.skip_tags:
+                self.soup.endData()
+                self._skip_depth = 1
+            else:
+                super().start(tag, attrib, nsmap)
+        
+        def end(self, tag):
+            if self._skip_depth:
+                self._skip_depth -= 1
+            else:
+                super().end(tag)
+        
+        def data(self, data):
+            if not self._skip_depth:
+                super().data(data)
+        
+        def comment(self, text):
+            if not self._skip_depth:
+                super().comment(text)
+
+
+# ==============================================================================
+# PLACEHOLDER DETECTION
+# ==============================================================================
+
+PLACEHOLDER_PATTERNS = (
+    r"lorem ipsum",
+    r"dolor sit amet",
+    r"placeholder",
+    r"coming soon",
+    r"under construction",
+    r"todo",
+    r"tbd",
+    r"insert .* here",
+    r"your .* here",
+    r"\[.*\]",  # [bracketed placeholders]
+)
+
+# A placeholder pattern without any of these is plain text
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _placeholder_matcher(pattern: str):
+    """
+    Build a callable that tells whether lowercased text contains pattern.
+    
+    The page text is lowercased before matching, so plain-text patterns
+    become a substring test, and only real regexes go through RE2 (or re) -
+    without IGNORECASE when already lowercase, as it disables re's fast
+    literal scan.
+    """
+    if _REGEX_METACHARS.isdisjoint(pattern):
+        literal = pattern.lower()
+        return lambda text: literal in text
+    if pattern != pattern.lower():
+        # Inline rather than re.IGNORECASE, which RE2 doesn't take
+        pattern = "(?i)" + pattern
+    try:
+        return _placeholder_re.compile(pattern).search
+    except _placeholder_re.error:
+        return re.compile(pattern).search
+
+
+_PLACEHOLDER_MATCHERS = tuple(
+    (pattern, _placeholder_matcher(pattern)) for pattern in PLACEHOLDER_PATTERNS
+)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """text cut to limit characters, with "..." appended if it was cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class ContentAuditor:
     """
@@ -47,32 +187,31 @@ class ContentAuditor:
     Designed for content migration, inventory, and quality assurance.
     """
     
-    def __init__(self, min_paragraph_length: int = 50, detect_placeholder: bool = True):
+    def __init__(self, min_paragraph_length: int = 50, detect_placeholder: bool = True,
+                 parser: str = "lxml"):
         """
         Initialize the content auditor.
         
         Args:
             min_paragraph_length: Minimum characters for a paragraph to be considered "substantial"
             detect_placeholder: Whether to flag common placeholder text patterns
+            parser: BeautifulSoup tree builder; lxml (C) is much faster than
+                    the pure-Python "html.parser"
         """
+        self.parser = parser
         self.content_tags = CONTENT_TAGS
         self.ignore_tags = CONTENT_IGNORE_TAGS
         self.min_paragraph_length = min_paragraph_length
         self.detect_placeholder = detect_placeholder
         
-        # Common placeholder text patterns to detect
-        self.placeholder_patterns = [
-            r"lorem ipsum",
-            r"dolor sit amet",
-            r"placeholder",
-            r"coming soon",
-            r"under construction",
-            r"todo",
-            r"tbd",
-            r"insert .* here",
-            r"your .* here",
-            r"\[.*\]",  # [bracketed placeholders]
-        ]
+        # Common placeholder text patterns to detect, with their matchers
+        # (compiled once at import, shared by every instance)
+        self.placeholder_patterns = list(PLACEHOLDER_PATTERNS)
+        self._placeholder_matchers = _PLACEHOLDER_MATCHERS
+        
+        # Joined class strings of context/section elements, keyed by id();
+        # many results share one parent, so each is joined once per page
+        self._class_cache = {}
     
     def audit(self, url: str, html: str) -> List[Dict[str, Any]]:
         """
@@ -89,88 +228,245 @@ class ContentAuditor:
         """
         results = []
         
-        # Parse the HTML
-        soup = BeautifulSoup(html, "html.parser")
+        # ids are only meaningful while this page's tree is alive
+        self._class_cache.clear()
+        
+        # Parse the HTML. On lxml the ignored tags (scripts, styles, nav,
+        # etc.) are dropped while the tree is built; other parsers build
+        # them and they're removed afterwards.
+        if self.parser == "lxml" and LXMLTreeBuilder is not None:
+            soup = BeautifulSoup(html, builder=_SkippingTreeBuilder(self.ignore_tags))
+        else:
+            soup = BeautifulSoup(html, self.parser)
+            for tag in soup.find_all(self.ignore_tags):
+                tag.decompose()
+        
+        # Walk the tree once; each phase below formats its own bucket
+        page = self._collect(soup)
         
-        # Remove ignored tags (scripts, styles, nav, etc.)
-        for tag in soup.find_all(self.ignore_tags):
-            tag.decompose()
+        # Page text, gathered by the walk for the placeholder and stats
+        # phases (the same as soup.get_text(separator=" "))
+        all_text = page["text"]
         
         # =====================================================================
         # PHASE 1: Extract and catalog all headings
         # =====================================================================
-        heading_results = self._extract_headings(soup)
+        heading_results = self._extract_headings(page["headings"])
         results.extend(heading_results)
         
         # =====================================================================
         # PHASE 2: Extract paragraph content
         # =====================================================================
-        paragraph_results = self._extract_paragraphs(soup)
+        paragraph_results = self._extract_paragraphs(page["paragraphs"])
         results.extend(paragraph_results)
         
         # =====================================================================
         # PHASE 3: Extract list content
         # =====================================================================
-        list_results = self._extract_lists(soup)
+        list_results = self._extract_lists(page["lists"])
         results.extend(list_results)
         
         # =====================================================================
         # PHASE 4: Extract calls-to-action
         # =====================================================================
-        cta_results = self._extract_ctas(soup)
+        cta_results = self._extract_ctas(page["ctas"])
         results.extend(cta_results)
         
         # =====================================================================
         # PHASE 5: Detect sections and their content
         # =====================================================================
-        section_results = self._analyze_sections(soup)
+        section_results = self._analyze_sections(page["sections"])
         results.extend(section_results)
         
         # =====================================================================
         # PHASE 6: Check for placeholder content
         # =====================================================================
         if self.detect_placeholder:
-            placeholder_results = self._detect_placeholders(soup)
+            placeholder_results = self._detect_placeholders(all_text)
             results.extend(placeholder_results)
         
         # =====================================================================
         # PHASE 7: Content statistics summary
         # =====================================================================
-        stats_results = self._generate_stats(soup)
+        stats_results = self._generate_stats(all_text, page)
         results.extend(stats_results)
         
         return results
     
-    def _extract_headings(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _collect(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Walk the page once and sort out the elements each phase reports on.
+        
+        Every bucket is in document order, and as each element is visited
+        exactly once, a button/link that is a CTA by both its class and its
+        text appears once - no set() of Tags (whose hash serializes the
+        whole subtree, and which merged distinct but identical-looking
+        elements). Sections also get their content
+        counts (headings, paragraphs, lists, images, stripped text length)
+        accumulated during the same walk rather than by searching each one,
+        and headings, paragraphs, lists and CTAs are paired with their
+        nearest enclosing section/div/article from a stack of the elements
+        the walk is inside, rather than a find_parent() per element. The
+        page text and the image/link totals for the stats phase come from
+        the same walk, so nothing traverses the tree a second time.
+        
+        Args:
+            soup: BeautifulSoup parsed HTML, ignored tags already removed
+            
+        Returns:
+            Dict with "headings", "paragraphs", "lists" and "ctas" as
+            (tag, context_element_or_None) pairs, "sections" as (tag, counts)
+            pairs where counts is [headings, paragraphs, lists, images,
+            text_length], "text" (the page text, joined with spaces like
+            get_text(separator=" ")), and "images", "internal_links" and
+            "external_links" counts
+        """
+        headings, paragraphs, lists, ctas, sections = [], [], [], [], []
+        
+        # Page text strings, and the counters the stats phase reports
+        texts = []
+        images = internal_links = external_links = 0
+        
+        # Counts of every section enclosing the current node
+        open_counts = []
+        
+        # Enclosing section/div/article elements, innermost last
+        contexts = []
+        
+        stack = list(reversed(soup.contents))
+        while stack:
+            node = stack.pop()
+            
+            if node is _LEAVE_SECTION:
+                open_counts.pop()
+                continue
+            if node is _LEAVE_CONTEXT:
+                contexts.pop()
+                continue
+            
+            if not isinstance(node, Tag):
+                if type(node) in _TEXT_TYPES:
+                    texts.append(node)
+                    if open_counts:
+                        length = len(node.strip())
+                        if length:
+                            for counts in open_counts:
+                                counts[4] += length
+                continue
+            
+            name = node.name
+            context = contexts[-1] if contexts else None
+            counter = None
+            if name in HEADING_TAGS:
+                headings.append((node, context))
+                counter = 0
+            elif name == "p":
+                paragraphs.append((node, context))
+                counter = 1
+            elif name in LIST_TAGS:
+                lists.append((node, context))
+                counter = 2
+            elif name == "img":
+                images += 1
+                counter = 3
+            
+            if counter is not None:
+                for counts in open_counts:
+                    counts[counter] += 1
+            
+            if name == "a" or name == "button":
+                href = node.get("href") if name == "a" else None
+                if href is not None:
+                    # Internal and external prefixes are exclusive
+                    if href.startswith(("/", "#")):
+                        internal_links += 1
+                    elif href.startswith("http"):
+                        external_links += 1
+                if (self._has_class_keyword(node, CTA_CLASS_RE)
+                        or (name == "a" and self._has_cta_text(node))):
+                    ctas.append((node, context))
+            
+            if name in SECTION_TAGS or (name == "div" and self._has_class_keyword(node, SECTION_CLASS_RE)):
+                counts = [0, 0, 0, 0, 0]
+                sections.append((node, counts))
+                open_counts.append(counts)
+                stack.append(_LEAVE_SECTION)
+            
+            if name in CONTEXT_TAGS:
+                contexts.append(node)
+                stack.append(_LEAVE_CONTEXT)
+            
+            stack.extend(reversed(node.contents))
+        
+        return {
+            "headings": headings,
+            "paragraphs": paragraphs,
+            "lists": lists,
+            "ctas": ctas,
+            "sections": sections,
+            "text": " ".join(texts),
+            "images": images,
+            "internal_links": internal_links,
+            "external_links": external_links,
+        }
+    
+    @staticmethod
+    def _has_class_keyword(tag: Tag, keyword_re: "re.Pattern") -> bool:
+        """Whether any of the tag's classes contains a keyword (keyword_re)."""
+        classes = tag.get("class")
+        if not classes:
+            return False
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
+        return keyword_re.search(classes.lower()) is not None
+    
+    def _class_string(self, tag: Optional[Tag]) -> str:
+        """
+        A tag's classes joined with spaces ("" for None or no classes).
+        
+        Memoized per page in self._class_cache, keyed by the tag's id().
+        """
+        if tag is None:
+            return ""
+        key = id(tag)
+        classes = self._class_cache.get(key)
+        if classes is None:
+            classes = self._class_cache[key] = " ".join(tag.get("class") or ())
+        return classes
+    
+    @staticmethod
+    def _has_cta_text(tag: Tag) -> bool:
+        """Whether a link's sole text (its .string) reads like a CTA."""
+        text = tag.string
+        if not text:
+            return False
+        return CTA_TEXT_RE.search(text.lower()) is not None
+    
+    def _extract_headings(self, headings: List[tuple]) -> List[Dict[str, Any]]:
         """
         Extract all headings and their hierarchy.
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            headings: (h1-h6 element, context element) pairs from _collect
             
         Returns:
             List of heading content results
         """
         results = []
         
-        headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-        
-        for i, heading in enumerate(headings):
+        for i, (heading, parent) in enumerate(headings):
             text = heading.get_text(strip=True)
             level = heading.name
             
-            # Get parent section/div class for context
-            parent = heading.find_parent(["section", "div", "article"])
-            parent_class = ""
-            if parent and parent.get("class"):
-                parent_class = " ".join(parent.get("class", []))
+            # Parent section/div class for context
+            parent_class = self._class_string(parent)
             
             results.append({
                 "type": "content",
                 "element": "heading",
                 "property": f"{level} ({i+1})",
                 "expected": "Meaningful heading text",
-                "found": text[:100] + ("..." if len(text) > 100 else ""),
+                "found": _truncate(text, 100),
                 "status": STATUS_MATCH if len(text) > 0 else STATUS_MISSING,
                 "context": parent_class,
                 "full_text": text,
@@ -178,25 +474,29 @@ class ContentAuditor:
         
         return results
     
-    def _extract_paragraphs(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_paragraphs(self, paragraphs: List[tuple]) -> List[Dict[str, Any]]:
         """
         Extract paragraph content and assess quality.
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            paragraphs: (<p> element, context element) pairs from _collect
             
         Returns:
             List of paragraph content results
         """
         results = []
         
-        paragraphs = soup.find_all("p")
-        
         substantial_count = 0
         thin_count = 0
         empty_count = 0
         
-        for i, para in enumerate(paragraphs):
+        # Loop invariants, hoisted out of the per-paragraph work
+        min_length = self.min_paragraph_length
+        expected = f"≥{min_length} characters"
+        append = results.append
+        class_string = self._class_string
+        
+        for i, (para, parent) in enumerate(paragraphs):
             text = para.get_text(strip=True)
             length = len(text)
             
@@ -205,7 +505,7 @@ class ContentAuditor:
                 empty_count += 1
                 status = STATUS_MISSING
                 category = "empty"
-            elif length < self.min_paragraph_length:
+            elif length < min_length:
                 thin_count += 1
                 status = "⚠️ Thin content"
                 category = "thin"
@@ -214,18 +514,15 @@ class ContentAuditor:
                 status = STATUS_MATCH
                 category = "substantial"
             
-            # Get parent context
-            parent = para.find_parent(["section", "div", "article"])
-            parent_class = ""
-            if parent and parent.get("class"):
-                parent_class = " ".join(parent.get("class", []))
+            # Parent section/div class for context
+            parent_class = class_string(parent)
             
-            results.append({
+            append({
                 "type": "content",
                 "element": "paragraph",
                 "property": f"p ({i+1}) - {category}",
-                "expected": f"≥{self.min_paragraph_length} characters",
-                "found": f"{length} chars: '{text[:80]}{'...' if len(text) > 80 else ''}'",
+                "expected": expected,
+                "found": f"{length} chars: '{_truncate(text, 80)}'",
                 "status": status,
                 "context": parent_class,
                 "full_text": text,
@@ -244,21 +541,19 @@ class ContentAuditor:
         
         return results
     
-    def _extract_lists(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_lists(self, lists: List[tuple]) -> List[Dict[str, Any]]:
         """
         Extract list content (ul, ol).
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            lists: (<ul>/<ol> element, context element) pairs from _collect
             
         Returns:
             List of list content results
         """
         results = []
         
-        lists = soup.find_all(["ul", "ol"])
-        
-        for i, lst in enumerate(lists):
+        for i, (lst, parent) in enumerate(lists):
             list_type = "ordered" if lst.name == "ol" else "unordered"
             items = lst.find_all("li", recursive=False)
             item_count = len(items)
@@ -269,11 +564,8 @@ class ContentAuditor:
             if len(item_texts) > 3:
                 preview += f" | ... (+{len(item_texts) - 3} more)"
             
-            # Get parent context
-            parent = lst.find_parent(["section", "div", "article"])
-            parent_class = ""
-            if parent and parent.get("class"):
-                parent_class = " ".join(parent.get("class", []))
+            # Parent section/div class for context
+            parent_class = self._class_string(parent)
             
             results.append({
                 "type": "content",
@@ -288,47 +580,34 @@ class ContentAuditor:
         
         return results
     
-    def _extract_ctas(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_ctas(self, all_ctas: List[tuple]) -> List[Dict[str, Any]]:
         """
         Extract calls-to-action (buttons and prominent links).
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            all_ctas: (element, context element) pairs from _collect for
+                      buttons/links with CTA-like classes and links with
+                      CTA-like text
             
         Returns:
             List of CTA content results
         """
         results = []
         
-        # Find buttons
-        buttons = soup.find_all(["button", "a"], class_=lambda x: x and any(
-            kw in str(x).lower() for kw in ["btn", "button", "cta", "action"]
-        ))
-        
-        # Also find links with button-like text
-        action_links = soup.find_all("a", string=lambda x: x and any(
-            kw in x.lower() for kw in ["contact", "get started", "learn more", "find out", "sign up", "subscribe"]
-        ))
-        
-        all_ctas = list(set(buttons + action_links))
-        
-        for i, cta in enumerate(all_ctas):
+        for i, (cta, parent) in enumerate(all_ctas):
             text = cta.get_text(strip=True)
             href = cta.get("href", "N/A")
             tag = cta.name
             
-            # Get parent context
-            parent = cta.find_parent(["section", "div", "article"])
-            parent_class = ""
-            if parent and parent.get("class"):
-                parent_class = " ".join(parent.get("class", []))
+            # Parent section/div class for context
+            parent_class = self._class_string(parent)
             
             results.append({
                 "type": "content",
                 "element": "cta",
                 "property": f"{tag} ({i+1})",
                 "expected": "Clear call-to-action text",
-                "found": f"'{text}' → {href[:50]}{'...' if len(str(href)) > 50 else ''}",
+                "found": f"'{text}' → {_truncate(href, 50)}",
                 "status": STATUS_MATCH if text else STATUS_MISSING,
                 "context": parent_class,
             })
@@ -346,43 +625,27 @@ class ContentAuditor:
         
         return results
     
-    def _analyze_sections(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _analyze_sections(self, all_sections: List[tuple]) -> List[Dict[str, Any]]:
         """
         Analyze content sections for completeness.
         
         Looks for common section patterns and checks if they have content.
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            all_sections: (tag, counts) pairs from _collect for semantic
+                          sections and divs with section-like classes
             
         Returns:
             List of section analysis results
         """
         results = []
         
-        # Find semantic sections
-        sections = soup.find_all(["section", "article", "main"])
-        
-        # Also find divs with section-like classes
-        section_divs = soup.find_all("div", class_=lambda x: x and any(
-            kw in str(x).lower() for kw in ["section", "block", "container", "wrapper", "hero", "footer", "header"]
-        ))
-        
-        all_sections = list(set(sections + section_divs))
-        
-        for i, section in enumerate(all_sections):
-            classes = " ".join(section.get("class", []))
+        for i, (section, counts) in enumerate(all_sections):
+            classes = self._class_string(section)
             tag = section.name
             
-            # Count content elements within section
-            headings = len(section.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]))
-            paragraphs = len(section.find_all("p"))
-            lists = len(section.find_all(["ul", "ol"]))
-            images = len(section.find_all("img"))
-            
-            # Get text content length
-            text_content = section.get_text(strip=True)
-            text_length = len(text_content)
+            # Content counts gathered during the page walk
+            headings, paragraphs, lists, images, text_length = counts
             
             # Determine if section has substantial content
             has_content = headings > 0 or paragraphs > 0 or text_length > 100
@@ -399,26 +662,24 @@ class ContentAuditor:
         
         return results
     
-    def _detect_placeholders(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _detect_placeholders(self, all_text: str) -> List[Dict[str, Any]]:
         """
         Detect placeholder or dummy content.
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            all_text: The page's text (soup.get_text(separator=" "))
             
         Returns:
             List of placeholder detection results
         """
         results = []
         
-        # Get all text content
-        all_text = soup.get_text(separator=" ").lower()
+        all_text = all_text.lower()
         
-        placeholders_found = []
-        
-        for pattern in self.placeholder_patterns:
-            if re.search(pattern, all_text, re.IGNORECASE):
-                placeholders_found.append(pattern)
+        placeholders_found = [
+            pattern for pattern, matches in self._placeholder_matchers
+            if matches(all_text)
+        ]
         
         if placeholders_found:
             results.append({
@@ -443,12 +704,13 @@ class ContentAuditor:
         
         return results
     
-    def _generate_stats(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _generate_stats(self, all_text: str, page: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Generate content statistics summary.
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            all_text: The page's text (soup.get_text(separator=" "))
+            page: Element buckets from _collect
             
         Returns:
             List of statistics results
@@ -456,7 +718,6 @@ class ContentAuditor:
         results = []
         
         # Word count
-        all_text = soup.get_text(separator=" ")
         words = len(all_text.split())
         
         results.append({
@@ -496,7 +757,7 @@ class ContentAuditor:
         })
         
         # Image count
-        images = len(soup.find_all("img"))
+        images = page["images"]
         
         results.append({
             "type": "content",
@@ -508,17 +769,16 @@ class ContentAuditor:
             "context": "page-level",
         })
         
-        # Link count (internal vs external)
-        all_links = soup.find_all("a", href=True)
-        internal_links = [l for l in all_links if l["href"].startswith("/") or l["href"].startswith("#")]
-        external_links = [l for l in all_links if l["href"].startswith("http")]
+        # Link count (internal vs external), tallied during the page walk
+        internal_links = page["internal_links"]
+        external_links = page["external_links"]
         
         results.append({
             "type": "content",
             "element": "statistics",
             "property": "link-count",
             "expected": "N/A (informational)",
-            "found": f"{len(internal_links)} internal, {len(external_links)} external",
+            "found": f"{internal_links} internal, {external_links} external",
             "status": STATUS_MATCH,
             "context": "page-level",
         })
@@ -22,13 +22,32 @@ Date: January 2026
 ================================================================================
 """
 
+import os
 import re
 import math
-from typing import Dict, List, Any, Optional, Tuple
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup, Tag
 import requests
+from requests.adapters import HTTPAdapter
+
+# tinycss2 is optional. With it, stylesheets are tokenized properly (rules
+# nested in @media, braces inside strings and comments, @keyframes blocks);
+# without it, a rule regex splits them up as before.
+try:
+    import tinycss2
+except ImportError:
+    tinycss2 = None
+
+# requests-cache is optional - only needed for use_cache=True
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 # Try to import configuration with fallbacks
 try:
@@ -43,6 +62,8 @@ try:
         STATUS_ROGUE,
         STATUS_IN_RANGE,
         STATUS_OUT_OF_RANGE,
+        STYLESHEET_CACHE_NAME,
+        STYLESHEET_CACHE_EXPIRE,
     )
 except ImportError:
     # Fallback defaults
@@ -61,6 +82,148 @@ except ImportError:
     STATUS_ROGUE = "❌ Rogue"
     STATUS_IN_RANGE = "✅ In range"
     STATUS_OUT_OF_RANGE = "❌ Out of range"
+    STYLESHEET_CACHE_NAME = ".audit_cache_css"
+    STYLESHEET_CACHE_EXPIRE = 86400
+
+# Elements _validate_sections checks against the palette's section rules
+SECTION_RULE_TAGS = frozenset(["div", "section", "footer", "header"])
+
+
+# ==============================================================================
+# PRECOMPILED PATTERNS
+# ==============================================================================
+
+# "property: value" for each color property. Each property is searched for
+# on its own and only its first declaration counts - so "color" also
+# matches inside "background-color", as it always has.
+COLOR_PROPERTY_RES = tuple(
+    (prop, prop.lower(), re.compile(rf'{prop}\s*:\s*([^;]+)', re.IGNORECASE))
+    for prop in COLOR_PROPERTIES
+)
+
+HEX_COLOR_RE = re.compile(r'#[0-9a-fA-F]{3,8}')
+RGB_COLOR_RE = re.compile(r'rgba?\([^)]+\)')
+HSL_COLOR_RE = re.compile(r'hsla?\([^)]+\)')
+NUMBER_RE = re.compile(r'[\d.]+')
+
+BACKGROUND_IMAGE_RE = re.compile(r'background-image\s*:\s*url\(["\']?([^"\')\s]+)["\']?\)')
+BACKGROUND_COLOR_RE = re.compile(r'background(?:-color)?\s*:\s*([^;]+)')
+BLEND_MODE_RE = re.compile(r'(?:mix-blend-mode|background-blend-mode)\s*:\s*([^;]+)')
+OPACITY_RE = re.compile(r'opacity\s*:\s*([\d.]+)')
+
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_RULE_RE = re.compile(r'([^{]+)\{([^}]+)\}')
+PSEUDO_SELECTOR_RE = re.compile(r'::?[a-z-]+')
+ATTRIBUTE_SELECTOR_RE = re.compile(r'\[.*?\]')
+
+# A compound selector of just a type and/or classes and ids ("div", ".hero",
+# "a.button.is-primary", "#nav"), with identifiers as soupsieve reads them
+_CSS_IDENT = r'(?:--|-?[_a-zA-Z\u00a0-\U0010ffff])[-\w\u00a0-\U0010ffff]*'
+SIMPLE_COMPOUND_RE = re.compile(rf'(\*|{_CSS_IDENT})?((?:[.#]{_CSS_IDENT})*)')
+SIMPLE_PART_RE = re.compile(rf'([.#])({_CSS_IDENT})')
+COMBINATOR_RE = re.compile(r'\s*[>+~]\s*|\s+')
+
+# Palettes at least this large are searched with NumPy (when installed) in
+# _find_nearest_color; below it, per-call array overhead outweighs the loop
+NUMPY_MIN_PALETTE = 32
+
+# A soupsieve match() call on one element costs about as much as testing
+# this many elements in a select_one() pass over the page (see _select_first)
+SELECTOR_MATCH_COST = 4
+
+# Upper bound on stylesheets kept in _css_parse_cache. A site's shared CSS
+# and site-wide embeds stay cached; per-page embeds only cycle through it
+CSS_PARSE_CACHE_SIZE = 64
+
+# Most stylesheets linked from one page that are downloaded at once
+STYLESHEET_FETCH_WORKERS = 8
+
+# At-rules whose block holds ordinary style rules that apply to the page
+GROUPING_AT_RULES = frozenset(["media", "supports", "layer", "container"])
+
+
+def _iter_css_rules(css: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (selector, declarations) for each style rule in a stylesheet.
+    
+    Other at-rules (@font-face, @keyframes, @import, ...) are skipped.
+    """
+    if tinycss2 is None:
+        for match in CSS_RULE_RE.finditer(CSS_COMMENT_RE.sub('', css)):
+            selector = match.group(1).strip()
+            
+            # Skip empty selectors or @rules (media queries, keyframes, etc.)
+            if selector and not selector.startswith('@'):
+                yield selector, match.group(2)
+        return
+    
+    yield from _iter_rule_list(
+        tinycss2.parse_stylesheet(css, skip_comments=True, skip_whitespace=True)
+    )
+
+
+def _iter_rule_list(rules) -> Iterator[Tuple[str, str]]:
+    """_iter_css_rules for a list of tinycss2 nodes, descending into @media etc."""
+    for rule in rules:
+        if rule.type == "qualified-rule":
+            selector = tinycss2.serialize(rule.prelude).strip()
+            if selector:
+                yield selector, tinycss2.serialize(rule.content)
+        elif (rule.type == "at-rule" and rule.content is not None
+                and rule.lower_at_keyword in GROUPING_AT_RULES):
+            yield from _iter_rule_list(
+                tinycss2.parse_rule_list(rule.content, skip_comments=True, skip_whitespace=True)
+            )
+
+
+@functools.lru_cache(maxsize=4096)
+def _simple_selector(selector: str) -> Optional[Tuple[Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]], ...]]:
+    """
+    Split a selector list into (type, classes, ids) compounds.
+    
+    Returns None if any part of the list is more than that - combinators,
+    pseudo-classes, escapes and the like are left to soupsieve. The type is
+    lowercased (HTML type selectors ignore case) and None for "*" or none.
+    """
+    compounds = []
+    for part in selector.split(","):
+        match = SIMPLE_COMPOUND_RE.fullmatch(part.strip())
+        if not match or not match.group(0):
+            return None
+        
+        tag, rest = match.groups()
+        classes = []
+        ids = []
+        for kind, name in SIMPLE_PART_RE.findall(rest):
+            (classes if kind == "." else ids).append(name)
+        
+        compounds.append((
+            tag.lower() if tag and tag != "*" else None,
+            tuple(classes),
+            tuple(ids),
+        ))
+    return tuple(compounds)
+
+
+@functools.lru_cache(maxsize=4096)
+def _selector_chain(selector: str) -> Optional[Tuple[Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]], ...]]:
+    """
+    Split a single complex selector (".nav > li a.active") into its
+    compounds, as _simple_selector reads them, without the combinators.
+    
+    Returns None for selector lists, escapes or strings, or if any compound
+    is more than a type/class/id compound.
+    """
+    if "," in selector or "\\" in selector or '"' in selector or "'" in selector:
+        return None
+    
+    chain = []
+    for part in COMBINATOR_RE.split(selector.strip()):
+        compounds = _simple_selector(part)
+        if compounds is None:
+            return None
+        chain.append(compounds[0])
+    return tuple(chain)
 
 
 class DesignAuditor:
@@ -73,15 +236,25 @@ class DesignAuditor:
     - source_context: Where the style originates
     """
     
-    def __init__(self, palette_name: str = "lasting_change", palette_module=None):
+    # Stylesheet sessions shared by every auditor in the process, keyed by
+    # (pid, use_cache) - see _shared_session
+    _sessions: Dict[Tuple[int, bool], requests.Session] = {}
+    
+    def __init__(self, palette_name: str = "lasting_change", palette_module=None,
+                 parser: str = "lxml", use_cache: bool = False):
         """
         Initialize the design auditor with a specific palette.
 
         Args:
             palette_name: Name of the palette module to load from palettes/
             palette_module: Optional pre-loaded palette module (takes precedence)
+            parser: BeautifulSoup tree builder; lxml (C) is much faster than
+                    the pure-Python "html.parser"
+            use_cache: Keep downloaded stylesheets in an on-disk cache shared
+                       by later runs (needs requests-cache)
         """
         self.palette_name = palette_name
+        self.parser = parser
 
         # Use provided module or load by name
         if palette_module is not None:
@@ -102,9 +275,82 @@ class DesignAuditor:
             if hex_code != "transparent":
                 self.approved_colors.add(hex_code.lower())
 
-        # Cache for external stylesheets
+        # Texture and blend-mode lookups, and the "expected" strings reported
+        # for them, are the same for every styled element on every page
+        approved_textures = self.palette.get("APPROVED_TEXTURES", {})
+        approved_blend_modes = self.palette.get("APPROVED_BLEND_MODES", [])
+        self._approved_textures_lower = frozenset(t.lower() for t in approved_textures)
+        self._approved_blends_lower = frozenset(m.lower() for m in approved_blend_modes)
+        self._approved_textures_str = f"Approved: {', '.join(approved_textures.keys())}"
+        self._approved_blends_str = f"Approved: {', '.join(approved_blend_modes)}"
+
+        # Cache for external stylesheets, and a keep-alive session to fetch
+        # them with (a page's sheets usually share one or two CDN hosts)
         self._stylesheet_cache = {}
+        self._session = self._shared_session(use_cache)
+
+        # Near-miss search state, built on first use: approved colors as
+        # (hex, rgb) pairs, a NumPy copy for large palettes, and results
+        # per color (the same few colors recur on every page of a site)
+        self._palette_rgb = None
+        self._palette_array = None
+        self._nearest_cache = {}
+
+        # (full_selector, parent_context, text_snippet) per element, keyed by
+        # id(); cleared per page, as ids are only unique while its tree lives
+        self._context_cache = {}
+
+        # Each stylesheet's colored rules, evaluated, keyed by (content hash,
+        # source): a site's shared CSS is the same text on every page.
+        # Cleared when it reaches CSS_PARSE_CACHE_SIZE entries.
+        self._css_parse_cache = {}
 
+        # (soup, index) for the page being audited; see _page_index
+        self._soup_index = None
+
+    @classmethod
+    def _shared_session(cls, use_cache: bool) -> requests.Session:
+        """
+        Get the process-wide session for fetching stylesheets.
+        
+        With use_cache, it's a requests_cache.CachedSession on disk, so a
+        site's CSS (the same webflow.*.css on every page) is downloaded once
+        across runs. Cache-Control headers are honored - no-store responses
+        aren't kept, and max-age overrides STYLESHEET_CACHE_EXPIRE.
+        
+        Sessions are per process: forked --audit-processes workers inherit
+        the parent's dict, but must not reuse its SQLite connection or
+        pooled sockets, so each opens its own.
+        
+        Args:
+            use_cache: Whether to use the on-disk stylesheet cache
+            
+        Returns:
+            A requests.Session (a requests_cache.CachedSession when caching)
+        """
+        if use_cache and requests_cache is None:
+            print("  [WARN] requests-cache not installed - stylesheets won't be cached on disk")
+            use_cache = False
+        
+        key = (os.getpid(), use_cache)
+        session = cls._sessions.get(key)
+        if session is None:
+            if use_cache:
+                session = requests_cache.CachedSession(
+                    cache_name=STYLESHEET_CACHE_NAME,
+                    backend="sqlite",
+                    expire_after=STYLESHEET_CACHE_EXPIRE,
+                    cache_control=True,
+                    allowable_methods=("GET",),
+                )
+            else:
+                session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._sessions[key] = session
+        return session
+    
     def _get_empty_palette(self) -> Dict:
         """Return an empty palette structure with sensible defaults."""
         return {
@@ -184,26 +430,25 @@ class DesignAuditor:
         parts = []
         current = element
         
-        # Walk up the tree (limit to 5 levels to avoid overly long selectors)
+        # Walk up the tree (limit to 5 levels to avoid overly long selectors),
+        # innermost first; reversed once at the end
         depth = 0
         while current and current.name and depth < 5:
-            # Build selector for this element
-            selector = current.name
+            attrs = current.attrs
             
-            # Add classes
-            classes = current.get("class", [])
-            if classes:
-                selector += "." + ".".join(classes)
-            
-            # Add ID if present (but not Webflow's auto-generated IDs)
-            element_id = current.get("id", "")
+            # Add ID if present (but not Webflow's auto-generated IDs),
+            # otherwise the tag name and its classes
+            element_id = attrs.get("id", "")
             if element_id and not element_id.startswith("w-"):
-                selector = f"#{element_id}"
+                parts.append(f"#{element_id}")
+            else:
+                classes = attrs.get("class")
+                parts.append(f"{current.name}.{'.'.join(classes)}" if classes else current.name)
             
-            parts.insert(0, selector)
             current = current.parent
             depth += 1
         
+        parts.reverse()
         return " > ".join(parts)
     
     def _get_parent_context(self, element: Tag) -> str:
@@ -221,17 +466,15 @@ class DesignAuditor:
         parents = []
         current = element.parent
         
-        # Get up to 2 parent levels
+        # Get up to 2 parent levels, innermost first
         depth = 0
         while current and current.name and depth < 2:
-            selector = current.name
-            classes = current.get("class", [])
-            if classes:
-                selector += "." + ".".join(classes)
-            parents.insert(0, selector)
+            classes = current.attrs.get("class")
+            parents.append(f"{current.name}.{'.'.join(classes)}" if classes else current.name)
             current = current.parent
             depth += 1
         
+        parents.reverse()
         return " > ".join(parents) if parents else "root"
     
     def _determine_source_context(self, element: Tag, property_name: str, 
@@ -263,6 +506,30 @@ class DesignAuditor:
         else:
             return f"Class Style ({found_in})"
     
+    def _element_context(self, element: Tag) -> Tuple[str, str, str]:
+        """
+        Get an element's full selector, parent context and text snippet.
+        
+        One element is often reported many times (several colors in one
+        style attribute, a texture, many CSS rules matching it), so the
+        parent-chain walks and get_text() run once per element per page.
+        
+        Args:
+            element: BeautifulSoup Tag element
+            
+        Returns:
+            Tuple of (full_selector, parent_context, text_snippet)
+        """
+        key = id(element)
+        context = self._context_cache.get(key)
+        if context is None:
+            context = self._context_cache[key] = (
+                self._get_full_selector(element),
+                self._get_parent_context(element),
+                self._get_text_snippet(element),
+            )
+        return context
+    
     def _get_text_snippet(self, element: Tag, max_length: int = 50) -> str:
         """
         Extract a text snippet from an element for identification.
@@ -297,12 +564,17 @@ class DesignAuditor:
             List of audit result dictionaries with enhanced context
         """
         results = []
+        self._context_cache.clear()
+        self._soup_index = None
         
         # Parse the HTML
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, self.parser)
+        
+        # Elements with inline styles, found once for phases 1 and 4
+        styled = self._styled_elements(soup)
         
         # Phase 1: Extract colors from inline styles
-        inline_results = self._extract_inline_colors(soup, url)
+        inline_results = self._extract_inline_colors(styled, url)
         results.extend(inline_results)
         
         # Phase 2: Extract colors from <style> tags (Custom Code Embeds)
@@ -314,7 +586,7 @@ class DesignAuditor:
         results.extend(external_results)
         
         # Phase 4: Extract and validate textures
-        texture_results = self._extract_textures(soup, url)
+        texture_results = self._extract_textures(styled, url)
         results.extend(texture_results)
         
         # Phase 5: Section-specific validation
@@ -328,14 +600,29 @@ class DesignAuditor:
     # COLOR EXTRACTION - INLINE STYLES
     # ==========================================================================
     
-    def _extract_inline_colors(self, soup: BeautifulSoup, url: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _styled_elements(soup: BeautifulSoup) -> List[Tuple[Tag, str]]:
+        """
+        Find every element with a style attribute, in document order.
+        
+        Returns:
+            List of (element, style attribute value) pairs
+        """
+        styled = []
+        for element in soup.descendants:
+            if isinstance(element, Tag):
+                style = element.attrs.get("style")
+                if style is not None:
+                    styled.append((element, style))
+        return styled
+    
+    def _extract_inline_colors(self, styled: List[Tuple[Tag, str]], url: str) -> List[Dict[str, Any]]:
         """
         Extract colors from inline style attributes.
         """
         results = []
         
-        for element in soup.find_all(style=True):
-            style = element.get("style", "")
+        for element, style in styled:
             colors = self._parse_colors_from_style(style)
             
             for prop, color in colors:
@@ -377,31 +664,64 @@ class DesignAuditor:
         """
         results = []
         
-        for link in soup.find_all("link", rel="stylesheet"):
-            href = link.get("href")
-            if href:
-                stylesheet_url = urljoin(url, href)
-                
-                # Check cache first
-                if stylesheet_url in self._stylesheet_cache:
-                    css_content = self._stylesheet_cache[stylesheet_url]
-                else:
-                    try:
-                        response = requests.get(stylesheet_url, timeout=10)
-                        if response.status_code == 200:
-                            css_content = response.text
-                            self._stylesheet_cache[stylesheet_url] = css_content
-                        else:
-                            continue
-                    except Exception as e:
-                        print(f"  ⚠️ Could not fetch stylesheet {stylesheet_url}: {e}")
-                        continue
-                
-                css_results = self._parse_css_for_colors(css_content, soup, stylesheet_url, url)
-                results.extend(css_results)
+        stylesheet_urls = [
+            urljoin(url, link["href"])
+            for link in soup.find_all("link", rel="stylesheet")
+            if link.get("href")
+        ]
+        
+        # Download every sheet not cached yet up front, in parallel
+        self._fetch_stylesheets(
+            [u for u in dict.fromkeys(stylesheet_urls) if u not in self._stylesheet_cache]
+        )
+        
+        for stylesheet_url in stylesheet_urls:
+            css_content = self._stylesheet_cache.get(stylesheet_url)
+            if css_content is None:
+                continue
+            
+            css_results = self._parse_css_for_colors(css_content, soup, stylesheet_url, url)
+            results.extend(css_results)
         
         return results
     
+    def _fetch_stylesheets(self, stylesheet_urls: List[str]) -> None:
+        """
+        Download stylesheets into the cache, several at a time.
+        
+        Failed downloads (errors or non-200 responses) are left out of the
+        cache, so they are tried again on the next page that links them.
+        
+        Args:
+            stylesheet_urls: Absolute URLs of stylesheets not yet cached
+        """
+        if not stylesheet_urls:
+            return
+        
+        def fetch(stylesheet_url: str) -> Tuple[str, Optional[str], Optional[Exception]]:
+            try:
+                response = self._session.get(stylesheet_url, timeout=10)
+            except Exception as e:
+                return stylesheet_url, None, e
+            
+            if response.status_code != 200:
+                return stylesheet_url, None, None
+            return stylesheet_url, response.text, None
+        
+        if len(stylesheet_urls) == 1:
+            fetched = [fetch(stylesheet_urls[0])]
+        else:
+            workers = min(STYLESHEET_FETCH_WORKERS, len(stylesheet_urls))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(fetch, stylesheet_urls))
+        
+        # Cache and report in link order, from this thread
+        for stylesheet_url, css_content, error in fetched:
+            if css_content is not None:
+                self._stylesheet_cache[stylesheet_url] = css_content
+            elif error is not None:
+                print(f"  ⚠️ Could not fetch stylesheet {stylesheet_url}: {error}")
+    
     # ==========================================================================
     # CSS PARSING
     # ==========================================================================
@@ -410,69 +730,220 @@ class DesignAuditor:
                                source: str, url: str) -> List[Dict[str, Any]]:
         """
         Parse CSS content and extract all color values with context.
+        
+        Only matching each rule to this page's elements is done per call;
+        the rules' colors and their evaluation come from _css_color_rules.
         """
         results = []
 
-        # Strip CSS comments before parsing
-        css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
-
-        # Regex to match CSS rules: selector { properties }
-        rule_pattern = r'([^{]+)\{([^}]+)\}'
-
-        for match in re.finditer(rule_pattern, css):
-            selector = match.group(1).strip()
-            properties = match.group(2)
-
-            # Skip empty selectors or @rules (media queries, keyframes, etc.)
-            if not selector or selector.startswith('@'):
-                continue
-
-            # Try to find matching elements in the DOM for context
-            matching_elements = []
+        for selector, clean_selector, element_name, colors in self._css_color_rules(css, source):
+            # Try to find a matching element in the DOM for context
+            matching_element = None
             try:
-                # Clean up selector for BeautifulSoup (remove pseudo-elements)
-                clean_selector = re.sub(r'::?[a-z-]+', '', selector)
-                clean_selector = re.sub(r'\[.*?\]', '', clean_selector)
-                if clean_selector.strip():
-                    matching_elements = soup.select(clean_selector.strip())
+                if clean_selector:
+                    matching_element = self._select_first(soup, clean_selector)
             except Exception:
                 # Invalid CSS selectors are expected for some edge cases
                 pass
             
-            # Extract colors from properties
-            colors = self._parse_colors_from_style(properties)
+            # Use first matching element for context, or create synthetic context
+            if matching_element is not None:
+                full_selector, parent_context, text_snippet = self._element_context(matching_element)
+            else:
+                full_selector = selector
+                parent_context = "CSS Rule (no DOM match)"
+                text_snippet = ""
             
-            for prop, color in colors:
-                # Use first matching element for context, or create synthetic context
-                if matching_elements:
-                    element = matching_elements[0]
-                    full_selector = self._get_full_selector(element)
-                    parent_context = self._get_parent_context(element)
-                    text_snippet = self._get_text_snippet(element)
-                else:
-                    full_selector = selector
-                    parent_context = "CSS Rule (no DOM match)"
-                    text_snippet = ""
-                
+            for prop, source_context, evaluation in colors:
                 result = {
                     "url": url,
                     "type": "color",
-                    "element": selector.split()[-1] if selector else "unknown",
+                    "element": element_name,
                     "full_selector": full_selector,
                     "parent_context": parent_context,
                     "property": prop,
-                    "source_context": self._determine_source_context(None, prop, source),
+                    "source_context": source_context,
                     "text_snippet": text_snippet,
                 }
-                
-                # Evaluate the color
-                evaluation = self._evaluate_color_value(color)
                 result.update(evaluation)
                 
                 results.append(result)
         
         return results
     
+    def _select_first(self, soup: BeautifulSoup, selector: str) -> Optional[Tag]:
+        """
+        Find the first element (in document order) matching a CSS selector.
+        
+        Type, class and id selectors - most of a stylesheet - are answered
+        from the page index. Chains of them (".hero > .title") can only
+        match if each compound matches something, and then only elements
+        the last compound picks out are tried against the full selector.
+        Anything else is left to soupsieve.
+        
+        Args:
+            soup: Parsed page
+            selector: Selector without pseudo-elements or attribute tests
+            
+        Returns:
+            The first matching element, or None
+        """
+        compounds = _simple_selector(selector)
+        if compounds is not None:
+            positions = self._page_index(soup)[0]
+            first = None
+            for compound in compounds:
+                element = next(self._compound_matches(soup, compound), None)
+                if element is not None and (first is None or positions[id(element)] < positions[id(first)]):
+                    first = element
+            return first
+        
+        chain = _selector_chain(selector)
+        if chain is None:
+            return soup.select_one(selector)
+        
+        for compound in chain[:-1]:
+            if next(self._compound_matches(soup, compound), None) is None:
+                return None
+        
+        # A common last compound ("p", ".w-container") can leave most of the
+        # page to try, which one select_one() pass does for less
+        elements = self._page_index(soup)[1]
+        if len(self._compound_candidates(soup, chain[-1])) * SELECTOR_MATCH_COST > len(elements):
+            return soup.select_one(selector)
+        
+        # Compiled patterns are cached by soupsieve, so this is cheap per page
+        match = soup.css.compile(selector).match
+        for element in self._compound_matches(soup, chain[-1]):
+            if match(element):
+                return element
+        return None
+    
+    def _compound_matches(self, soup: BeautifulSoup,
+                          compound: Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]) -> Iterator[Tag]:
+        """
+        Yield the elements matching a _simple_selector compound, in document order.
+        """
+        tag, classes, ids = compound
+        
+        for element in self._compound_candidates(soup, compound):
+            if tag and element.name.lower() != tag:
+                continue
+            if ids and any(element.get("id") != i for i in ids):
+                continue
+            if classes:
+                element_classes = element.get("class", ())
+                if not all(cls in element_classes for cls in classes):
+                    continue
+            yield element
+    
+    def _compound_candidates(self, soup: BeautifulSoup,
+                             compound: Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]) -> List[Tag]:
+        """
+        The shortest indexed element list every match of a compound is in.
+        """
+        _, elements, by_tag, by_class, by_id = self._page_index(soup)
+        tag, classes, ids = compound
+        
+        if ids:
+            return by_id.get(ids[0], [])
+        if classes:
+            return min((by_class.get(cls, []) for cls in classes), key=len)
+        if tag:
+            return by_tag.get(tag, [])
+        return elements
+    
+    def _page_index(self, soup: BeautifulSoup) -> Tuple[Dict[int, int], List[Tag], Dict[str, List[Tag]],
+                                                       Dict[str, List[Tag]], Dict[str, List[Tag]]]:
+        """
+        Index a page's elements by type, class and id, in one walk.
+        
+        Built on first use and kept until the next audit() - a stylesheet has
+        hundreds of rules to look up, and most of them match nothing.
+        
+        Returns:
+            (document position by id(element), all elements, then element
+            lists by lowercased type, by class and by id, in document order)
+        """
+        if self._soup_index is not None and self._soup_index[0] is soup:
+            return self._soup_index[1]
+        
+        positions = {}
+        elements = []
+        by_tag = {}
+        by_class = {}
+        by_id = {}
+        
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            positions[id(element)] = len(elements)
+            elements.append(element)
+            by_tag.setdefault(element.name.lower(), []).append(element)
+            
+            attrs = element.attrs
+            for cls in attrs.get("class", ()):
+                tagged = by_class.setdefault(cls, [])
+                if not tagged or tagged[-1] is not element:
+                    tagged.append(element)
+            
+            element_id = attrs.get("id")
+            if element_id:
+                by_id.setdefault(element_id, []).append(element)
+        
+        index = (positions, elements, by_tag, by_class, by_id)
+        self._soup_index = (soup, index)
+        return index
+    
+    def _css_color_rules(self, css: str, source: str) -> Tuple[Tuple[str, str, str, Tuple], ...]:
+        """
+        Get the rules of a stylesheet that set colors, with the colors evaluated.
+        
+        None of this depends on the page, so it's memoized by a hash of the
+        CSS text (and its source, which the source context is built from).
+        
+        Args:
+            css: Stylesheet text
+            source: Where it came from ("embedded" or the stylesheet URL)
+            
+        Returns:
+            (selector, clean_selector, element, colors) per colored rule, in
+            order; clean_selector is the selector without pseudo-classes or
+            attribute tests (for soup.select), and colors holds a
+            (property, source_context, evaluation) tuple per color found
+        """
+        key = (hashlib.blake2b(css.encode(), digest_size=16).digest(), source)
+        rules = self._css_parse_cache.get(key)
+        if rules is not None:
+            return rules
+        
+        rules = []
+        for selector, properties in _iter_css_rules(css):
+            colors = self._parse_colors_from_style(properties)
+            if not colors:
+                continue
+            
+            # Clean up selector for BeautifulSoup (remove pseudo-elements)
+            clean_selector = PSEUDO_SELECTOR_RE.sub('', selector)
+            clean_selector = ATTRIBUTE_SELECTOR_RE.sub('', clean_selector).strip()
+            
+            rules.append((
+                selector,
+                clean_selector,
+                selector.split()[-1] if selector else "unknown",
+                tuple(
+                    (prop, self._determine_source_context(None, prop, source),
+                     self._evaluate_color_value(color))
+                    for prop, color in colors
+                ),
+            ))
+        
+        rules = tuple(rules)
+        if len(self._css_parse_cache) >= CSS_PARSE_CACHE_SIZE:
+            self._css_parse_cache.clear()
+        self._css_parse_cache[key] = rules
+        return rules
+    
     def _parse_colors_from_style(self, style: str) -> List[Tuple[str, str]]:
         """
         Extract color values from a CSS style string.
@@ -481,27 +952,32 @@ class DesignAuditor:
         """
         colors = []
         
-        for prop in COLOR_PROPERTIES:
-            pattern = rf'{prop}\s*:\s*([^;]+)'
-            match = re.search(pattern, style, re.IGNORECASE)
+        # Most styles mention only a few color properties; a substring test
+        # rules the others out before their regex runs
+        style_lower = style.lower()
+        
+        for prop, prop_lower, prop_re in COLOR_PROPERTY_RES:
+            if prop_lower not in style_lower:
+                continue
+            match = prop_re.search(style)
             
             if match:
                 value = match.group(1).strip()
                 
                 # Extract hex colors
-                hex_matches = re.findall(r'#[0-9a-fA-F]{3,8}', value)
+                hex_matches = HEX_COLOR_RE.findall(value)
                 for hex_color in hex_matches:
                     colors.append((prop, self._normalize_hex(hex_color)))
                 
                 # Extract rgb/rgba colors
-                rgb_matches = re.findall(r'rgba?\([^)]+\)', value)
+                rgb_matches = RGB_COLOR_RE.findall(value)
                 for rgb_color in rgb_matches:
                     hex_equiv = self._rgb_to_hex(rgb_color)
                     if hex_equiv:
                         colors.append((prop, hex_equiv))
                 
                 # Extract hsl/hsla colors
-                hsl_matches = re.findall(r'hsla?\([^)]+\)', value)
+                hsl_matches = HSL_COLOR_RE.findall(value)
                 for hsl_color in hsl_matches:
                     hex_equiv = self._hsl_to_hex(hsl_color)
                     if hex_equiv:
@@ -522,15 +998,16 @@ class DesignAuditor:
         """
         Evaluate a color against the approved palette with full context.
         """
+        full_selector, parent_context, text_snippet = self._element_context(element)
         result = {
             "url": url,
             "type": "color",
             "element": element.name,
-            "full_selector": self._get_full_selector(element),
-            "parent_context": self._get_parent_context(element),
+            "full_selector": full_selector,
+            "parent_context": parent_context,
             "property": property_name,
             "source_context": self._determine_source_context(element, property_name, source),
-            "text_snippet": self._get_text_snippet(element),
+            "text_snippet": text_snippet,
         }
         
         evaluation = self._evaluate_color_value(color)
@@ -582,7 +1059,7 @@ class DesignAuditor:
     # TEXTURE EXTRACTION AND VALIDATION
     # ==========================================================================
     
-    def _extract_textures(self, soup: BeautifulSoup, url: str) -> List[Dict[str, Any]]:
+    def _extract_textures(self, styled: List[Tuple[Tag, str]], url: str) -> List[Dict[str, Any]]:
         """
         Extract and validate texture usage with full context.
         """
@@ -591,16 +1068,18 @@ class DesignAuditor:
         if not self.palette:
             return results
         
-        approved_textures = self.palette.get("APPROVED_TEXTURES", {})
-        approved_blend_modes = self.palette.get("APPROVED_BLEND_MODES", [])
+        approved_textures = self._approved_textures_lower
+        approved_blend_modes = self._approved_blends_lower
+        textures_expected = self._approved_textures_str
+        blends_expected = self._approved_blends_str
         opacity_range = self.palette.get("TEXTURE_OPACITY_RANGE", (0.05, 0.20))
         
         # Find elements with background-image styles
-        for element in soup.find_all(style=True):
-            style = element.get("style", "")
+        for element, style in styled:
+            full_selector, parent_context, text_snippet = self._element_context(element)
             
             # Check for background-image
-            bg_match = re.search(r'background-image\s*:\s*url\(["\']?([^"\')\s]+)["\']?\)', style)
+            bg_match = BACKGROUND_IMAGE_RE.search(style)
             if bg_match:
                 texture_url = bg_match.group(1)
                 texture_filename = texture_url.split('/')[-1].split('?')[0]
@@ -609,18 +1088,18 @@ class DesignAuditor:
                     "url": url,
                     "type": "texture",
                     "element": element.name,
-                    "full_selector": self._get_full_selector(element),
-                    "parent_context": self._get_parent_context(element),
+                    "full_selector": full_selector,
+                    "parent_context": parent_context,
                     "source_context": "Inline Style",
-                    "text_snippet": self._get_text_snippet(element),
+                    "text_snippet": text_snippet,
                 }
                 
                 # Validate texture file
-                if texture_filename.lower() in [t.lower() for t in approved_textures.keys()]:
+                if texture_filename.lower() in approved_textures:
                     results.append({
                         **base_result,
                         "property": "texture-file",
-                        "expected": f"Approved: {', '.join(approved_textures.keys())}",
+                        "expected": textures_expected,
                         "found": texture_filename,
                         "status": STATUS_MATCH,
                     })
@@ -628,13 +1107,13 @@ class DesignAuditor:
                     results.append({
                         **base_result,
                         "property": "texture-file",
-                        "expected": f"Approved: {', '.join(approved_textures.keys())}",
+                        "expected": textures_expected,
                         "found": texture_filename,
                         "status": f"{STATUS_MISMATCH} (unapproved file)",
                     })
             
             # Check for blend mode
-            blend_match = re.search(r'(?:mix-blend-mode|background-blend-mode)\s*:\s*([^;]+)', style)
+            blend_match = BLEND_MODE_RE.search(style)
             if blend_match:
                 blend_mode = blend_match.group(1).strip().lower()
                 
@@ -642,17 +1121,17 @@ class DesignAuditor:
                     "url": url,
                     "type": "texture",
                     "element": element.name,
-                    "full_selector": self._get_full_selector(element),
-                    "parent_context": self._get_parent_context(element),
+                    "full_selector": full_selector,
+                    "parent_context": parent_context,
                     "source_context": "Inline Style",
                     "text_snippet": "",
                 }
                 
-                if blend_mode in [m.lower() for m in approved_blend_modes]:
+                if blend_mode in approved_blend_modes:
                     results.append({
                         **base_result,
                         "property": "blend-mode",
-                        "expected": f"Approved: {', '.join(approved_blend_modes)}",
+                        "expected": blends_expected,
                         "found": blend_mode,
                         "status": STATUS_MATCH,
                     })
@@ -660,13 +1139,13 @@ class DesignAuditor:
                     results.append({
                         **base_result,
                         "property": "blend-mode",
-                        "expected": f"Approved: {', '.join(approved_blend_modes)}",
+                        "expected": blends_expected,
                         "found": blend_mode,
                         "status": STATUS_MISMATCH,
                     })
             
             # Check for opacity
-            opacity_match = re.search(r'opacity\s*:\s*([\d.]+)', style)
+            opacity_match = OPACITY_RE.search(style)
             if opacity_match:
                 opacity = float(opacity_match.group(1))
                 min_opacity, max_opacity = opacity_range
@@ -675,8 +1154,8 @@ class DesignAuditor:
                     "url": url,
                     "type": "texture",
                     "element": element.name,
-                    "full_selector": self._get_full_selector(element),
-                    "parent_context": self._get_parent_context(element),
+                    "full_selector": full_selector,
+                    "parent_context": parent_context,
                     "source_context": "Inline Style",
                     "text_snippet": "",
                 }
@@ -712,7 +1191,10 @@ class DesignAuditor:
         section_rules = self.palette.get("SECTION_RULES", {})
         get_section_rules = self.palette.get("get_section_rules", lambda x: None)
         
-        for element in soup.find_all(['div', 'section', 'footer', 'header']):
+        # A set lookup per node; find_all() with a list of names is much slower
+        for element in soup.descendants:
+            if element.name not in SECTION_RULE_TAGS:
+                continue
             classes = element.get("class", [])
             if not classes:
                 continue
@@ -723,21 +1205,22 @@ class DesignAuditor:
             if rules:
                 style = element.get("style", "")
                 
+                full_selector, parent_context, text_snippet = self._element_context(element)
                 base_result = {
                     "url": url,
                     "type": "section",
                     "element": element.name,
-                    "full_selector": self._get_full_selector(element),
-                    "parent_context": self._get_parent_context(element),
+                    "full_selector": full_selector,
+                    "parent_context": parent_context,
                     "source_context": "Section Rules",
-                    "text_snippet": self._get_text_snippet(element),
+                    "text_snippet": text_snippet,
                 }
                 
                 # Validate background color
                 if rules.get("background_color"):
                     expected_color = rules["background_color"]
                     
-                    bg_match = re.search(r'background(?:-color)?\s*:\s*([^;]+)', style)
+                    bg_match = BACKGROUND_COLOR_RE.search(style)
                     found_color = bg_match.group(1).strip() if bg_match else "not found in inline style"
                     
                     if found_color.startswith('#'):
@@ -757,7 +1240,7 @@ class DesignAuditor:
                 if rules.get("blend_mode"):
                     expected_blend = rules["blend_mode"]
                     
-                    blend_match = re.search(r'(?:mix-blend-mode|background-blend-mode)\s*:\s*([^;]+)', style)
+                    blend_match = BLEND_MODE_RE.search(style)
                     found_blend = blend_match.group(1).strip() if blend_match else "not found"
                     
                     status = STATUS_MATCH if found_blend.lower() == expected_blend.lower() else STATUS_MISMATCH
@@ -775,7 +1258,7 @@ class DesignAuditor:
                     min_op, max_op = rules["opacity_range"]
                     expected_opacity = f"{min_op*100:.0f}–{max_op*100:.0f}%"
                     
-                    opacity_match = re.search(r'opacity\s*:\s*([\d.]+)', style)
+                    opacity_match = OPACITY_RE.search(style)
                     if opacity_match:
                         found_opacity = float(opacity_match.group(1))
                         found_str = f"{found_opacity*100:.0f}%"
@@ -814,7 +1297,7 @@ class DesignAuditor:
     def _rgb_to_hex(self, rgb_string: str) -> Optional[str]:
         """Convert rgb() or rgba() to hex."""
         try:
-            numbers = re.findall(r'[\d.]+', rgb_string)
+            numbers = NUMBER_RE.findall(rgb_string)
             if len(numbers) >= 3:
                 r = int(float(numbers[0]))
                 g = int(float(numbers[1]))
@@ -827,7 +1310,7 @@ class DesignAuditor:
     def _hsl_to_hex(self, hsl_string: str) -> Optional[str]:
         """Convert hsl() or hsla() to hex."""
         try:
-            numbers = re.findall(r'[\d.]+', hsl_string)
+            numbers = NUMBER_RE.findall(hsl_string)
             if len(numbers) >= 3:
                 h = float(numbers[0]) / 360
                 s = float(numbers[1]) / 100
@@ -872,23 +1355,52 @@ class DesignAuditor:
         if not self.approved_colors:
             return None, float('inf')
         
+        cached = self._nearest_cache.get(hex_color)
+        if cached is not None:
+            return cached
+        
         try:
-            r1, g1, b1 = self._hex_to_rgb(hex_color)
+            target = self._hex_to_rgb(hex_color)
         except ValueError:
             return None, float('inf')
         
-        nearest = None
-        min_distance = float('inf')
+        if self._palette_rgb is None:
+            self._build_palette_rgb()
+        
+        if self._palette_array is not None:
+            # Squared distances to the whole palette in one vectorized step
+            d2 = ((self._palette_array - target) ** 2).sum(axis=1)
+            index = int(d2.argmin())
+            nearest = self._palette_rgb[index][0]
+            min_distance = math.sqrt(int(d2[index]))
+        else:
+            r1, g1, b1 = target
+            nearest = None
+            min_d2 = None
+            for approved, (r2, g2, b2) in self._palette_rgb:
+                d2 = (r1-r2)**2 + (g1-g2)**2 + (b1-b2)**2
+                if min_d2 is None or d2 < min_d2:
+                    min_d2 = d2
+                    nearest = approved
+            min_distance = math.sqrt(min_d2) if nearest is not None else float('inf')
         
+        result = self._nearest_cache[hex_color] = (nearest, min_distance)
+        return result
+    
+    def _build_palette_rgb(self):
+        """Parse the approved colors once for _find_nearest_color."""
+        self._palette_rgb = []
         for approved in self.approved_colors:
             try:
-                r2, g2, b2 = self._hex_to_rgb(approved)
-                distance = math.sqrt((r1-r2)**2 + (g1-g2)**2 + (b1-b2)**2)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest = approved
+                self._palette_rgb.append((approved, self._hex_to_rgb(approved)))
             except ValueError:
                 continue
         
-        return nearest, min_distance
+        if len(self._palette_rgb) >= NUMPY_MIN_PALETTE:
+            try:
+                import numpy as np
+            except ImportError:
+                return
+            self._palette_array = np.array(
+                [rgb for _, rgb in self._palette_rgb], dtype=np.int32
+            )
@@ -36,6 +36,11 @@ from config import (
     STATUS_OUT_OF_RANGE,
 )
 
+# Heading elements, checked with one set lookup per node. BeautifulSoup's
+# find_all() with a list of names is several times slower than a plain scan
+# of soup.descendants.
+HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+
 
 class SEOAuditor:
     """
@@ -394,8 +399,11 @@ class SEOAuditor:
         """
         results = []
         
+        # All headings in document order, from one pass over the tree
+        headings = [tag for tag in soup.descendants if tag.name in HEADING_TAGS]
+        
         # Count H1 tags
-        h1_tags = soup.find_all("h1")
+        h1_tags = [h for h in headings if h.name == "h1"]
         h1_count = len(h1_tags)
         
         if h1_count == 1:
@@ -430,8 +438,6 @@ class SEOAuditor:
             })
         
         # Check heading hierarchy
-        headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-        
         if headings:
             levels = [int(h.name[1]) for h in headings]
             
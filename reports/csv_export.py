@@ -9,6 +9,7 @@ Required imports by main.py:
 - generate_all_reports
 - get_site_report_dir
 - get_reports_base_dir
+- ResultsLog
 
 Features:
 - Variable Candidate column for hard-coded values that should be variables
@@ -65,8 +66,7 @@ def get_site_report_dir(base_url=None, site_path=None):
     """
     report_dir = get_reports_base_dir(base_url, site_path)
 
-    if not os.path.exists(report_dir):
-        os.makedirs(report_dir)
+    os.makedirs(report_dir, exist_ok=True)
 
     return report_dir
 
@@ -118,9 +118,9 @@ def truncate(text, max_length=50):
 # CSV REPORT GENERATORS
 # =============================================================================
 
-def generate_color_report(issues, output_dir):
+def generate_color_report(issues, output_dir, run_tag=None):
     """Generate CSV report for color audit findings."""
-    filename = f"color_audit_{generate_timestamp()}.csv"
+    filename = f"color_audit_{run_tag or generate_timestamp()}.csv"
     filepath = os.path.join(output_dir, filename)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -145,9 +145,9 @@ def generate_color_report(issues, output_dir):
     return filepath
 
 
-def generate_seo_report(issues, output_dir):
+def generate_seo_report(issues, output_dir, run_tag=None):
     """Generate CSV report for SEO audit findings."""
-    filename = f"seo_audit_{generate_timestamp()}.csv"
+    filename = f"seo_audit_{run_tag or generate_timestamp()}.csv"
     filepath = os.path.join(output_dir, filename)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -168,9 +168,9 @@ def generate_seo_report(issues, output_dir):
     return filepath
 
 
-def generate_content_report(issues, output_dir):
+def generate_content_report(issues, output_dir, run_tag=None):
     """Generate CSV report for content audit findings."""
-    filename = f"content_audit_{generate_timestamp()}.csv"
+    filename = f"content_audit_{run_tag or generate_timestamp()}.csv"
     filepath = os.path.join(output_dir, filename)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -191,9 +191,9 @@ def generate_content_report(issues, output_dir):
     return filepath
 
 
-def generate_design_report(issues, output_dir):
+def generate_design_report(issues, output_dir, run_tag=None):
     """Generate CSV report for design audit findings (colors, textures, sections)."""
-    filename = f"design_audit_{generate_timestamp()}.csv"
+    filename = f"design_audit_{run_tag or generate_timestamp()}.csv"
     filepath = os.path.join(output_dir, filename)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -219,13 +219,13 @@ def generate_design_report(issues, output_dir):
     return filepath
 
 
-def generate_variable_candidates_report(issues, output_dir):
+def generate_variable_candidates_report(issues, output_dir, run_tag=None):
     """Generate a dedicated CSV report for all variable candidates."""
     candidates = [i for i in issues if i.get('variable_candidate')]
     if not candidates:
         return None
 
-    filename = f"variable_candidates_{generate_timestamp()}.csv"
+    filename = f"variable_candidates_{run_tag or generate_timestamp()}.csv"
     filepath = os.path.join(output_dir, filename)
 
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -247,9 +247,9 @@ def generate_variable_candidates_report(issues, output_dir):
     return filepath
 
 
-def generate_summary_report(issues, url, output_dir):
+def generate_summary_report(issues, url, output_dir, run_tag=None):
     """Generate a summary CSV with counts and source context breakdown."""
-    filename = f"audit_summary_{generate_timestamp()}.csv"
+    filename = f"audit_summary_{run_tag or generate_timestamp()}.csv"
     filepath = os.path.join(output_dir, filename)
 
     # Count by type
@@ -312,11 +312,70 @@ def generate_summary_report(issues, url, output_dir):
     return filepath
 
 
+# =============================================================================
+# STREAMING RESULTS LOG
+# =============================================================================
+
+RESULTS_LOG_COLUMNS = [
+    'url', 'type', 'element', 'full_selector', 'parent_context', 'property',
+    'expected', 'found', 'status', 'source_context', 'variable_candidate',
+    'context', 'text_snippet'
+]
+
+
+class ResultsLog:
+    """
+    Append audit results to a CSV as each page is audited.
+
+    The file is only created (and its header written) once the first
+    results arrive, and it is flushed after every page, so an interrupted
+    crawl still leaves everything audited so far on disk. Keys outside
+    RESULTS_LOG_COLUMNS are ignored; missing ones are left blank.
+    """
+
+    def __init__(self, output_dir, run_tag=None):
+        self.filepath = os.path.join(output_dir, f"audit_results_{run_tag or generate_timestamp()}.csv")
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, page_url, results):
+        """Write one page's results and flush them to disk."""
+        if not results:
+            return
+
+        if self._writer is None:
+            self._file = open(self.filepath, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=RESULTS_LOG_COLUMNS,
+                restval='', extrasaction='ignore'
+            )
+            self._writer.writeheader()
+
+        for result in results:
+            result.setdefault('url', page_url)
+        self._writer.writerows(results)
+        self._file.flush()
+        self.rows_written += len(results)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 # =============================================================================
 # HTML REPORT GENERATOR - Matches sophisticated report format
 # =============================================================================
 
-def generate_html_report(issues, url, output_dir):
+def generate_html_report(issues, url, output_dir, run_tag=None):
     """
     Generate an interactive HTML report matching the sophisticated format with:
     - Summary cards (Total, Passed, Warnings, Failed, Pass Rate)
@@ -326,7 +385,7 @@ def generate_html_report(issues, url, output_dir):
     - Color swatches for hex values
     - Full Selector and Parent Context columns
     """
-    filename = f"audit_all_{generate_timestamp()}.html"
+    filename = f"audit_all_{run_tag or generate_timestamp()}.html"
     filepath = os.path.join(output_dir, filename)
 
     # Extract domain for title
@@ -817,14 +876,14 @@ def generate_html_report(issues, url, output_dir):
 # ROGUE COLORS SUMMARY HTML REPORT
 # =============================================================================
 
-def generate_rogue_colors_summary_html(issues, url, output_dir):
+def generate_rogue_colors_summary_html(issues, url, output_dir, run_tag=None):
     """
     Generate an HTML summary report for rogue (non-matching) colors showing:
     - Overall counts by color value
     - Counts by page
     - Counts by source context
     """
-    filename = f"rogue_colors_summary_{generate_timestamp()}.html"
+    filename = f"rogue_colors_summary_{run_tag or generate_timestamp()}.html"
     filepath = os.path.join(output_dir, filename)
 
     # Extract domain for title
@@ -1235,7 +1294,7 @@ def generate_rogue_colors_summary_html(issues, url, output_dir):
 # MAIN ENTRY POINT (Required by main.py)
 # =============================================================================
 
-def generate_all_reports(results, url=None, site_path=None):
+def generate_all_reports(results, url=None, site_path=None, formats="both", run_tag=None):
     """
     Generate all reports (CSV, HTML, summary) for the audit results.
     This is the main entry point called by main.py.
@@ -1245,11 +1304,17 @@ def generate_all_reports(results, url=None, site_path=None):
                  (NOT a dict with 'issues' key - it's the raw list)
         url: The audited site URL
         site_path: Path to site directory (e.g., ~/sites/lastingchange.co)
+        formats: "csv", "html" or "both" (--format); report types that
+                 weren't asked for aren't rendered at all
+        run_tag: Name used in place of the timestamp in every report
+                 filename (--output); defaults to the current timestamp
 
     Returns:
         Dict mapping report type to file path
     """
     output_dir = get_site_report_dir(url, site_path)
+    want_csv = formats in ("csv", "both")
+    want_html = formats in ("html", "both")
 
     print(f"Generating reports in: {output_dir}")
 
@@ -1272,44 +1337,46 @@ def generate_all_reports(results, url=None, site_path=None):
     design_issues = color_issues + texture_issues + section_issues
 
     # Generate type-specific CSV reports
-    if design_issues:
-        path = generate_design_report(design_issues, output_dir)
+    if want_csv and design_issues:
+        path = generate_design_report(design_issues, output_dir, run_tag)
         generated_files['design'] = path
         print(f"  ✓ Design report: {os.path.basename(path)} ({len(design_issues)} issues)")
 
     # Generate rogue colors summary HTML
-    if color_issues:
-        rogue_path = generate_rogue_colors_summary_html(color_issues, url, output_dir)
+    if want_html and color_issues:
+        rogue_path = generate_rogue_colors_summary_html(color_issues, url, output_dir, run_tag)
         if rogue_path:
             generated_files['rogue_colors'] = rogue_path
             rogue_count = sum(1 for i in color_issues if '✅' not in str(i.get('status', '')) and 'Match' not in str(i.get('status', '')))
             print(f"  ✓ Rogue colors summary: {os.path.basename(rogue_path)} ({rogue_count} rogue colors)")
 
-    if seo_issues:
-        path = generate_seo_report(seo_issues, output_dir)
+    if want_csv and seo_issues:
+        path = generate_seo_report(seo_issues, output_dir, run_tag)
         generated_files['seo'] = path
         print(f"  ✓ SEO report: {os.path.basename(path)} ({len(seo_issues)} issues)")
 
-    if content_issues:
-        path = generate_content_report(content_issues, output_dir)
+    if want_csv and content_issues:
+        path = generate_content_report(content_issues, output_dir, run_tag)
         generated_files['content'] = path
         print(f"  ✓ Content report: {os.path.basename(path)} ({len(content_issues)} issues)")
 
-    # Generate variable candidates report
-    variable_candidates_path = generate_variable_candidates_report(issues, output_dir)
-    if variable_candidates_path:
-        generated_files['variable_candidates'] = variable_candidates_path
-        candidate_count = sum(1 for i in issues if i.get('variable_candidate'))
-        print(f"  ✓ Variable candidates: {os.path.basename(variable_candidates_path)} ({candidate_count} candidates)")
-
-    # Generate summary CSV
-    summary_path = generate_summary_report(issues, url, output_dir)
-    generated_files['summary'] = summary_path
-    print(f"  ✓ Summary report: {os.path.basename(summary_path)}")
-
-    # Generate HTML report
-    html_path = generate_html_report(issues, url, output_dir)
-    generated_files['html'] = html_path
-    print(f"  ✓ HTML report: {os.path.basename(html_path)}")
+    if want_csv:
+        # Generate variable candidates report
+        variable_candidates_path = generate_variable_candidates_report(issues, output_dir, run_tag)
+        if variable_candidates_path:
+            generated_files['variable_candidates'] = variable_candidates_path
+            candidate_count = sum(1 for i in issues if i.get('variable_candidate'))
+            print(f"  ✓ Variable candidates: {os.path.basename(variable_candidates_path)} ({candidate_count} candidates)")
+
+        # Generate summary CSV
+        summary_path = generate_summary_report(issues, url, output_dir, run_tag)
+        generated_files['summary'] = summary_path
+        print(f"  ✓ Summary report: {os.path.basename(summary_path)}")
+
+    if want_html:
+        # Generate HTML report
+        html_path = generate_html_report(issues, url, output_dir, run_tag)
+        generated_files['html'] = html_path
+        print(f"  ✓ HTML report: {os.path.basename(html_path)}")
 
     return generated_files